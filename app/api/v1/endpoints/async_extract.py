@@ -1,9 +1,13 @@
 """
 Asynchronous extraction endpoints using Celery
 """
+import asyncio
+import os
+import shutil
+import uuid
 import structlog
 from fastapi import APIRouter, File, UploadFile, HTTPException, Query
-from typing import Dict
+from typing import BinaryIO, Dict
 from celery.result import AsyncResult
 
 from app.core.config import get_settings
@@ -15,6 +19,18 @@ logger = structlog.get_logger()
 router = APIRouter()
 settings = get_settings()
 
+# 업로드를 공유 디렉터리에 옮겨 쓸 때의 읽기 단위
+UPLOAD_COPY_CHUNK_SIZE = 1024 * 1024
+
+
+def _save_upload(src: BinaryIO, dst_path: str) -> None:
+    """Copy an uploaded (spooled) file to dst_path."""
+    # 청크마다 스레드풀을 오가는 UploadFile.read 대신 한 번의 스레드 호출로
+    # 복사하고, 버퍼 없는 FileIO로 써서 BufferedWriter 사본을 거치지 않음
+    src.seek(0)
+    with open(dst_path, 'wb', buffering=0) as dst:
+        shutil.copyfileobj(src, dst, UPLOAD_COPY_CHUNK_SIZE)
+
 
 @router.post("/submit",
     tags=["async"],
@@ -67,8 +83,11 @@ async def submit_extraction(
             detail="Invalid extraction type. Must be 'json', 'text', or 'markdown'"
         )
     
-    # Read file content
-    content = await file.read()
+    # Save file to the shared upload directory - 워커에는 파일 바이트 대신 경로만
+    # 전달해 브로커 직렬화(JSON base64)와 양쪽 메모리 사본을 없앰
+    file_ext = os.path.splitext(file.filename)[1].lower()
+    file_path = os.path.abspath(os.path.join(settings.UPLOAD_DIR, f"{uuid.uuid4()}{file_ext}"))
+    await asyncio.to_thread(_save_upload, file.file, file_path)
     
     # Prepare options
     options = {
@@ -78,12 +97,17 @@ async def submit_extraction(
     }
     
     # Submit task
-    task = extract_file_async.delay(
-        content,
-        file.filename,
-        extraction_type,
-        options
-    )
+    try:
+        task = extract_file_async.delay(
+            file_path,
+            file.filename,
+            extraction_type,
+            options
+        )
+    except Exception:
+        # 작업이 등록되지 않으면 워커가 파일을 지우지 않으므로 여기서 정리
+        os.unlink(file_path)
+        raise
     
     logger.info(
         "Extraction task submitted",
@@ -41,7 +41,9 @@ celery_app.conf.update(
     result_compression='gzip',  # Compress results to save memory
     
     # Worker optimization settings
-    worker_prefetch_multiplier=4,  # Increased for better throughput
+    # 추출 시간이 수십 ms~수십 초로 편차가 커서, 미리 가져온 작업이 느린 작업 뒤에서
+    # 기다리지 않도록 자식 프로세스당 하나만 예약 (task_acks_late와 함께 사용)
+    worker_prefetch_multiplier=1,
     worker_max_tasks_per_child=100,  # Prevent memory leaks
     worker_disable_rate_limits=False,
     worker_concurrency=os.cpu_count() * 2,  # Dynamic based on CPU cores
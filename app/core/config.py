@@ -38,6 +38,9 @@ class Settings(BaseSettings):
     CACHE_ENABLED: bool = False  # Disabled by default, enable with env var
     CACHE_TTL: int = 3600  # 1 hour default
     
+    # Virus scanning
+    VIRUS_SCAN_SIMULATE_DELAY: bool = False  # 개발용 시뮬레이션 검사 지연 (0.1-0.5초)
+    
     # Logging
     LOG_LEVEL: str = "INFO"
     LOG_FORMAT: str = "json"  # json or plain
@@ -62,7 +62,7 @@ class CachedExtractor:
                 include_statistics=kwargs.get("include_statistics", True)
             )
         elif extraction_type == "text":
-            text = self.parser.extract_text(file_path)
+            text = self.parser.text_from_content(parsed_content)
             if not kwargs.get("preserve_formatting", False):
                 text = ' '.join(text.split())
             result = {"text": text}
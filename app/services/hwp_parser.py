@@ -164,8 +164,18 @@ class HWPParser:
         Returns:
             Extracted text as string
         """
-        content = self.parse(file_path)
+        return self.text_from_content(self.parse(file_path))
+    
+    def text_from_content(self, content: Dict[str, Any]) -> str:
+        """
+        Build plain text from already parsed content.
         
+        Args:
+            content: Result of parse()
+            
+        Returns:
+            Extracted text as string
+        """
         # Extract text from parsed content
         text_parts = []
         
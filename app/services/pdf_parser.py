@@ -3,13 +3,33 @@ PDF Parser implementation for text extraction.
 """
 import structlog
 import fitz  # PyMuPDF
-import pdfplumber
-from typing import Dict, Any, List, Optional
+import functools
+import importlib
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Tuple
 import os
 import re
 
 logger = structlog.get_logger()
 
+# 테이블 추출 병렬화 설정
+TABLE_EXTRACTION_WORKERS = 4
+PARALLEL_TABLE_MIN_PAGES = 4
+
+# 문단 분리 패턴
+_PARAGRAPH_BREAK_RE = re.compile(r'\n\s*\n')
+_LIST_LINE_RE = re.compile(r'^\s*[\d\-•·▪▫◦‣⁃]\s', re.MULTILINE)
+
+
+@functools.cache
+def _load_pdfplumber():
+    """Import pdfplumber on first use.
+
+    pdfplumber(pdfminer, cryptography 포함)는 임포트에만 ~100ms가 걸리지만
+    PyMuPDF 실패 시 fallback과 테이블 추출에서만 쓰이므로 필요할 때 로드한다.
+    """
+    return importlib.import_module("pdfplumber")
+
 
 class PDFParser:
     """Parser for PDF files using multiple strategies."""
@@ -100,18 +120,19 @@ class PDFParser:
                 text = page.get_text()
                 page_paragraphs = []  # 빈 페이지 처리를 위해 초기화
 
-                if text.strip():
+                # strip() 복사 없이 공백 여부만 검사
+                if text and not text.isspace():
                     all_text.append(text)
 
                     # Split into paragraphs
                     page_paragraphs = self._split_into_paragraphs(text)
+                    # _split_into_paragraphs는 이미 strip된 비어있지 않은 문단만 반환
                     for para in page_paragraphs:
-                        if para.strip():
-                            paragraphs.append({
-                                "text": para.strip(),
-                                "page": page_num + 1,
-                                "style": {}
-                            })
+                        paragraphs.append({
+                            "text": para,
+                            "page": page_num + 1,
+                            "style": {}
+                        })
 
                 # Add page info to structure
                 result["structure"]["sections"].append({
@@ -151,6 +172,7 @@ class PDFParser:
         }
         
         try:
+            pdfplumber = _load_pdfplumber()
             with pdfplumber.open(file_path) as pdf:
                 result["structure"]["total_pages"] = len(pdf.pages)
                 
@@ -177,18 +199,19 @@ class PDFParser:
                     text = page.extract_text()
                     page_paragraphs = []  # 빈 페이지 처리를 위해 초기화
 
-                    if text:
+                    # extract_text()는 None을 반환할 수 있음
+                    if text and not text.isspace():
                         all_text.append(text)
 
                         # Split into paragraphs
                         page_paragraphs = self._split_into_paragraphs(text)
+                        # _split_into_paragraphs는 이미 strip된 비어있지 않은 문단만 반환
                         for para in page_paragraphs:
-                            if para.strip():
-                                paragraphs.append({
-                                    "text": para.strip(),
-                                    "page": page_num + 1,
-                                    "style": {}
-                                })
+                            paragraphs.append({
+                                "text": para,
+                                "page": page_num + 1,
+                                "style": {}
+                            })
                     
                     # Extract tables
                     page_tables = page.extract_tables()
@@ -221,64 +244,92 @@ class PDFParser:
         return result
     
     def _extract_tables_with_pdfplumber(self, file_path: str) -> List[Dict[str, Any]]:
-        """Extract tables specifically using pdfplumber."""
+        """Extract tables specifically using pdfplumber.
+
+        페이지 수가 PARALLEL_TABLE_MIN_PAGES 이상이면 페이지 범위를 나눠
+        스레드풀에서 병렬 추출한다. pdfminer 문서 객체는 파일 스트림을 공유해
+        스레드 안전하지 않으므로 각 워커는 자신의 pdfplumber 핸들을 연다.
+        """
         tables = []
-        
+
         try:
+            pdfplumber = _load_pdfplumber()
             with pdfplumber.open(file_path) as pdf:
-                for page_num, page in enumerate(pdf.pages):
-                    page_tables = page.extract_tables()
-                    for table_idx, table in enumerate(page_tables):
-                        if table and len(table) > 0:
-                            # Process table to create structured data
-                            processed_table = self._process_table(table)
-                            processed_table["page"] = page_num + 1
-                            processed_table["index"] = len(tables)
-                            tables.append(processed_table)
+                page_count = len(pdf.pages)
+                if page_count < PARALLEL_TABLE_MIN_PAGES:
+                    page_results = self._extract_page_tables(pdf.pages)
+
+            if page_count >= PARALLEL_TABLE_MIN_PAGES:
+                workers = min(TABLE_EXTRACTION_WORKERS, os.cpu_count() or 1, page_count)
+                step = -(-page_count // workers)  # ceil
+                page_ranges = [
+                    list(range(start + 1, min(start + step, page_count) + 1))
+                    for start in range(0, page_count, step)
+                ]
+
+                def extract_range(page_numbers: List[int]):
+                    with pdfplumber.open(file_path, pages=page_numbers) as part:
+                        return self._extract_page_tables(part.pages)
+
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    # map은 입력 순서를 유지하므로 페이지 순서가 보존됨
+                    page_results = [
+                        item
+                        for chunk in executor.map(extract_range, page_ranges)
+                        for item in chunk
+                    ]
+
+            for page_number, page_tables in page_results:
+                for table in page_tables:
+                    if table and len(table) > 0:
+                        # Process table to create structured data
+                        processed_table = self._process_table(table)
+                        processed_table["page"] = page_number
+                        processed_table["index"] = len(tables)
+                        tables.append(processed_table)
         except Exception as e:
             logger.warning("Failed to extract tables with pdfplumber", error=str(e))
-        
+
         return tables
+
+    @staticmethod
+    def _extract_page_tables(pages) -> List[Tuple[int, List[List[List[Optional[str]]]]]]:
+        """Return (1-based page number, raw tables) for each page."""
+        return [(page.page_number, page.extract_tables()) for page in pages]
     
     def _process_table(self, raw_table: List[List[str]]) -> Dict[str, Any]:
         """Process raw table data into structured format."""
-        if not raw_table or len(raw_table) == 0:
+        if not raw_table:
             return {"rows": [], "row_count": 0, "col_count": 0}
         
-        # Clean table data
-        cleaned_rows = []
-        for row in raw_table:
-            cleaned_row = []
-            for cell in row:
-                # Clean cell content
-                if cell is None:
-                    cleaned_row.append("")
-                else:
-                    cleaned_row.append(str(cell).strip())
-            cleaned_rows.append(cleaned_row)
-        
+        # Clean table data (None 셀은 빈 문자열로)
+        cleaned_rows = [
+            ["" if cell is None else str(cell).strip() for cell in row]
+            for row in raw_table
+        ]
+
+        # Assume first row is headers (raw_table이 비어있지 않음은 위에서 보장)
+        headers = cleaned_rows[0]
+
         # Create structured table
         table = {
             "rows": cleaned_rows,
             "row_count": len(cleaned_rows),
-            "col_count": len(cleaned_rows[0]) if cleaned_rows else 0,
-            "headers": [],
+            "col_count": len(headers),
+            "headers": headers,
             "structured_data": []
         }
-        
-        # Assume first row is headers
-        if len(cleaned_rows) > 0:
-            table["headers"] = cleaned_rows[0]
-            
-            # Create structured data
-            for row_idx, row in enumerate(cleaned_rows[1:], 1):
-                row_data = {}
-                for col_idx, cell in enumerate(row):
-                    if col_idx < len(table["headers"]):
-                        header = table["headers"][col_idx]
-                        if header:  # Only add if header is not empty
-                            row_data[header] = cell
-                
+
+        # 헤더가 모두 비어 있으면 structured_data는 항상 빈 리스트이므로
+        # 행 단위 dict 생성을 건너뜀
+        if any(headers):
+            # Create structured data (zip은 헤더 길이를 넘는 셀을 자동으로 잘라냄)
+            for row in cleaned_rows[1:]:
+                row_data = {
+                    header: cell
+                    for header, cell in zip(headers, row, strict=False)
+                    if header  # Only add if header is not empty
+                }
                 if row_data:
                     table["structured_data"].append(row_data)
         
@@ -293,25 +344,23 @@ class PDFParser:
         text = text.replace('\r\n', '\n').replace('\r', '\n')
         
         # Split by multiple newlines
-        paragraphs = re.split(r'\n\s*\n', text)
+        paragraphs = _PARAGRAPH_BREAK_RE.split(text)
         
         # Further split by common paragraph patterns
         result = []
         for para in paragraphs:
             # Check for numbered lists or bullet points
-            if re.search(r'^\s*[\d\-•·▪▫◦‣⁃]\s', para, re.MULTILINE):
-                # Split by line for lists
-                lines = para.split('\n')
-                current_item = []
-                for line in lines:
-                    if re.match(r'^\s*[\d\-•·▪▫◦‣⁃]\s', line):
-                        if current_item:
-                            result.append('\n'.join(current_item))
-                        current_item = [line]
-                    else:
-                        current_item.append(line)
-                if current_item:
-                    result.append('\n'.join(current_item))
+            if _LIST_LINE_RE.search(para):
+                # Split by line for lists - 항목 시작 줄마다 원본 문자열을
+                # 잘라내 줄 리스트/join 할당 없이 한 번에 처리
+                start = 0
+                pos = 0
+                for line in para.split('\n'):
+                    if pos > start and _LIST_LINE_RE.match(line):
+                        result.append(para[start:pos - 1])
+                        start = pos
+                    pos += len(line) + 1
+                result.append(para[start:])
             else:
                 # Regular paragraph
                 result.append(para)
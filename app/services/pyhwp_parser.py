@@ -3,14 +3,40 @@ PyHWP parser implementation.
 Uses pyhwp library for parsing HWP files.
 """
 import structlog
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 import subprocess
 import tempfile
 import json
 import os
+import re
+import struct
+import zlib
+
+from .improved_hwp_parser import HWPRecordParser
 
 logger = structlog.get_logger()
 
+# pyhwp Python API는 모듈 로드 시 한 번만 import (호출마다 import 비용 제거)
+try:
+    import pyhwp  # noqa: F401
+    from pyhwp.hwp5 import filestructure
+    _HAS_PYHWP = True
+except ImportError:
+    filestructure = None
+    _HAS_PYHWP = False
+
+# binmodel이 있으면 DocInfo를 타입이 있는 레코드 모델로 받을 수 있음
+try:
+    from pyhwp.hwp5 import binmodel
+except ImportError:
+    binmodel = None
+
+# 압축 여부 판별 시 raw deflate로 풀어볼 앞부분 크기
+DEFLATE_PROBE_SIZE = 64
+
+# BodyText 섹션 스트림 이름 (예: BodyText/Section0)
+_SECTION_STREAM_RE = re.compile(r'^BodyText/Section(\d+)$')
+
 
 def parse(file_path: str) -> Dict[str, Any]:
     """
@@ -50,11 +76,10 @@ def parse(file_path: str) -> Dict[str, Any]:
             return result
         
         # Method 2: Direct Python API
-        try:
-            import pyhwp
+        if _HAS_PYHWP:
             # Try to use pyhwp API directly
             result = parse_with_api(file_path)
-        except ImportError:
+        else:
             logger.warning("pyhwp Python API not available, falling back")
             
     except Exception as e:
@@ -137,10 +162,10 @@ def parse_with_api(file_path: str) -> Dict[str, Any]:
         }
     }
     
+    if not _HAS_PYHWP:
+        raise ImportError("pyhwp Python API not available")
+
     try:
-        import pyhwp
-        from pyhwp.hwp5 import filestructure
-        
         # Open HWP file
         hwp = filestructure.Hwp5File(file_path)
         
@@ -156,29 +181,38 @@ def parse_with_api(file_path: str) -> Dict[str, Any]:
         if 'DocInfo' in hwp:
             docinfo = hwp['DocInfo']
             # Parse document information stream
-            result["metadata"].update(parse_docinfo(docinfo))
+            result["metadata"].update(
+                parse_docinfo(docinfo, _open_docinfo_models(file_path))
+            )
         
         # Extract body text
         text_parts = []
-        section_count = 0
-        
+
         # Iterate through BodyText sections
-        for name in hwp.list_streams():
-            if name.startswith('BodyText/Section'):
-                section_count += 1
-                try:
-                    section_data = hwp[name].read()
-                    # Extract text from section
-                    section_text = extract_section_text(section_data)
-                    if section_text:
-                        text_parts.append(section_text)
-                        result["structure"]["sections"].append({
-                            "section_id": name,
-                            "text_length": len(section_text),
-                            "paragraph_count": len(section_text.split('\n\n'))
-                        })
-                except Exception as e:
-                    logger.warning(f"Failed to process {name}", error=str(e))
+        # 정규식으로 섹션 스트림만 골라 번호순 정렬 (문서 순서 보장)
+        streams = tuple(hwp.list_streams())
+        sections = sorted(
+            (int(m.group(1)), m.group(0))
+            for m in filter(None, map(_SECTION_STREAM_RE.match, streams))
+        )
+        section_count = len(sections)
+
+        for _, name in sections:
+            try:
+                section_data = hwp[name].read()
+                # Extract text from section
+                # Hwp5File은 FileHeader 압축 플래그에 따라 스트림을 이미
+                # 풀어서 돌려주므로 압축 해제를 다시 시도하지 않음
+                section_text = extract_section_text(section_data, is_compressed=False)
+                if section_text:
+                    text_parts.append(section_text)
+                    result["structure"]["sections"].append({
+                        "section_id": name,
+                        "text_length": len(section_text),
+                        "paragraph_count": len(section_text.split('\n\n'))
+                    })
+            except Exception as e:
+                logger.warning(f"Failed to process {name}", error=str(e))
         
         result["structure"]["total_sections"] = section_count
         result["text"] = "\n\n".join(text_parts)
@@ -202,63 +236,92 @@ def parse_with_api(file_path: str) -> Dict[str, Any]:
     return result
 
 
-def parse_docinfo(docinfo_stream) -> Dict[str, Any]:
-    """Parse DocInfo stream for metadata."""
+def _open_docinfo_models(file_path: str):
+    """Open DocInfo as a binmodel ModelStream, or None if unavailable."""
+    if binmodel is None:
+        return None
+    try:
+        # filestructure.Hwp5File의 DocInfo는 원시 스트림이라 models()가 없음.
+        # 이미 압축이 풀린 Hwp5File을 다시 감싸면 이중 해제되므로 경로로 연다
+        return binmodel.Hwp5File(file_path)['DocInfo']
+    except Exception as e:
+        logger.debug("Failed to open DocInfo models", error=str(e))
+        return None
+
+
+def parse_docinfo(docinfo_stream, docinfo_models=None) -> Dict[str, Any]:
+    """Parse DocInfo stream for metadata.
+
+    DocInfo는 레코드(태그/레벨/크기 헤더 + 본문) 나열이므로 바이트 단위로
+    훑지 않고 레코드 헤더만 따라가며 필요한 레코드만 struct로 읽는다.
+    제목/작성자는 DocInfo가 아닌 HwpSummaryInformation 스트림에 있다.
+
+    Args:
+        docinfo_stream: Raw DocInfo stream
+        docinfo_models: binmodel DocInfo (models() 제공) - 있으면 먼저 사용
+    """
     metadata = {}
-    
+
+    # pyhwp가 파싱한 DocInfo 모델에서 찾으면 바이너리를 직접 읽지 않음
+    if docinfo_models is not None:
+        try:
+            for model in docinfo_models.models():
+                if model.get('type') is binmodel.DocumentProperties:
+                    metadata["section_count"] = model['content']['section_count']
+                    break
+        except Exception as e:
+            logger.debug("Failed to read DocInfo models", error=str(e))
+        if "section_count" in metadata:
+            return metadata
+
     try:
-        # DocInfo contains document properties
-        # This is a simplified extraction - actual format is complex
         data = docinfo_stream.read()
-        
-        # Try to find title, author, etc. in the binary data
-        # This is a heuristic approach
-        text_parts = []
-        for i in range(0, len(data) - 1, 2):
-            # Try UTF-16LE decoding
-            try:
-                char = data[i:i+2].decode('utf-16le', errors='ignore')
-                if char.isprintable():
-                    text_parts.append(char)
-            except:
-                pass
-        
-        # Join and split by null characters
-        text = ''.join(text_parts)
-        fields = text.split('\x00')
-        
-        # Common patterns in DocInfo
-        for i, field in enumerate(fields):
-            field = field.strip()
-            if field:
-                # Try to identify metadata fields
-                if i == 0 and len(field) < 100:
-                    metadata["title"] = field
-                elif '@' in field and len(field) < 50:
-                    metadata["author"] = field.split('@')[0]
-                elif field.startswith('20') and len(field) == 8:
-                    # Possible date in YYYYMMDD format
-                    metadata["date"] = field
-                    
+        offset = 0
+        while offset < len(data):
+            tag_id, _, size, next_offset = HWPRecordParser.parse_record_header(data, offset)
+            if tag_id is None:
+                break
+
+            if tag_id == HWPRecordParser.HWPTAG_DOCUMENT_PROPERTIES and size >= 2:
+                # 본문 첫 UINT16이 구역(섹션) 개수
+                body_offset = next_offset - size
+                metadata["section_count"] = struct.unpack_from('<H', data, body_offset)[0]
+                break
+
+            offset = next_offset
+
     except Exception as e:
         logger.debug("Failed to parse DocInfo", error=str(e))
-    
+
     return metadata
 
 
-def extract_section_text(section_data: bytes) -> str:
-    """Extract text from section data."""
-    text_parts = []
-    
-    # HWP sections can be compressed
+def _looks_deflated(data: bytes) -> bool:
+    """앞부분만 raw deflate로 풀어보고 압축 스트림인지 빠르게 판별."""
     try:
-        import zlib
-        # Try to decompress
-        decompressed = zlib.decompress(section_data, -zlib.MAX_WBITS)
-        section_data = decompressed
-    except:
-        # Not compressed or decompression failed
-        pass
+        zlib.decompressobj(-zlib.MAX_WBITS).decompress(data[:DEFLATE_PROBE_SIZE])
+        return True
+    except zlib.error:
+        return False
+
+
+def extract_section_text(section_data: bytes, is_compressed: Optional[bool] = None) -> str:
+    """Extract text from section data.
+
+    Args:
+        section_data: Raw BodyText section stream
+        is_compressed: FileHeader 압축 플래그. None이면 앞부분을 검사해 판별
+    """
+    # HWP sections can be compressed
+    if is_compressed is None:
+        is_compressed = _looks_deflated(section_data)
+
+    if is_compressed:
+        try:
+            section_data = zlib.decompress(section_data, -zlib.MAX_WBITS)
+        except zlib.error:
+            # 검사 구간 이후에 깨진 경우 원본 데이터 사용
+            pass
     
     # Extract text with multiple encoding attempts
     encodings = ['utf-16le', 'utf-8', 'cp949', 'euc-kr']
@@ -2,18 +2,214 @@
 Streaming parser for large files with optimized memory management
 """
 import os
+import sys
 import asyncio
+import codecs
+import threading
 import structlog
-from typing import AsyncIterator, Dict, Any, Optional, BinaryIO
-import aiofiles
+from typing import AsyncIterator, Callable, Dict, Any, Iterator, List, Optional, BinaryIO, TypeVar
 import tempfile
 from contextlib import asynccontextmanager
 import mmap
+from collections import deque
+from app.services.hwp_parser import get_parser
 from app.services.text_extractor import TextExtractor
 from app.core.exceptions import FileTooLargeError, ProcessingError
+from app.utils.file_utils import copy_fd_range, regular_file_fd
 
 logger = structlog.get_logger()
 
+# 업로드 저장 시 한 번의 쓰기 호출로 모아서 기록할 청크 수
+WRITE_BATCH_CHUNKS = 8
+# 동시에 진행할 배치 기록 수 (오프셋 지정 쓰기가 없으면 순차 기록)
+MAX_INFLIGHT_WRITES = 4 if hasattr(os, 'pwritev') else 1
+# mmap 모듈에 상수가 없는 Python 버전용 Linux madvise 값
+# (MADV_POPULATE_READ는 Linux 5.14+, 이전 커널은 EINVAL로 무시됨)
+_MADV_FALLBACKS = {'MADV_POPULATE_READ': 22} if sys.platform.startswith('linux') else {}
+# 파일 크기에 비례해 키우는 읽기/쓰기 청크 크기 범위
+MIN_ADAPTIVE_CHUNK = 64 * 1024
+MAX_ADAPTIVE_CHUNK = 8 * 1024 * 1024
+# 워커 스레드 생산자가 소비자보다 앞서 만들어 둘 수 있는 청크 수
+STREAM_QUEUE_SIZE = 8
+# 업로드 진행률 로그 간격
+PROGRESS_LOG_INTERVAL = 10 * 1024 * 1024
+
+# content 필드에 텍스트를 담는 청크 종류
+_TEXT_CHUNK_TYPES = frozenset({'text_chunk', 'page'})
+
+# _iterate_in_thread 큐 메시지 종류
+_ITEM, _ERROR, _END = object(), object(), object()
+
+T = TypeVar('T')
+
+
+def _advise_sequential(fd: int) -> None:
+    """Hint the kernel that fd will be read front-to-back (larger readahead)."""
+    if hasattr(os, 'posix_fadvise'):
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        except OSError:
+            pass
+
+
+def _madvise(mm: mmap.mmap, advice_name: str, start: int = 0, length: int = 0) -> None:
+    """Apply an madvise hint if the platform supports it (no-op otherwise)."""
+    advice = getattr(mmap, advice_name, _MADV_FALLBACKS.get(advice_name))
+    if advice is None or not hasattr(mm, 'madvise'):
+        return
+    try:
+        mm.madvise(advice, start, length)
+    except OSError:
+        pass
+
+
+async def _iterate_in_thread(factory: Callable[..., Iterator[T]], *args) -> AsyncIterator[T]:
+    """Run a blocking generator in a worker thread and yield its items.
+
+    생산자는 STREAM_QUEUE_SIZE개까지 앞서 나갈 수 있고, 소비자가 느리면
+    세마포어에서 대기한다(backpressure). 청크마다 asyncio.sleep(0)으로
+    이벤트 루프를 한 바퀴 돌리지 않아도 생산과 소비가 겹쳐 실행된다.
+    """
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue()
+    slots = threading.Semaphore(STREAM_QUEUE_SIZE)
+    stop = threading.Event()
+
+    def produce() -> None:
+        iterator = factory(*args)
+        try:
+            for item in iterator:
+                slots.acquire()
+                if stop.is_set():
+                    return
+                loop.call_soon_threadsafe(queue.put_nowait, (_ITEM, item))
+        except Exception as e:
+            loop.call_soon_threadsafe(queue.put_nowait, (_ERROR, e))
+            return
+        finally:
+            # 생성기의 정리 코드(파일/문서 닫기)도 같은 워커 스레드에서 실행
+            iterator.close()
+        loop.call_soon_threadsafe(queue.put_nowait, (_END, None))
+
+    worker = asyncio.ensure_future(asyncio.to_thread(produce))
+    try:
+        while True:
+            kind, value = await queue.get()
+            if kind is _END:
+                break
+            if kind is _ERROR:
+                raise value
+            slots.release()
+            yield value
+    finally:
+        # 소비자가 중간에 멈추면 대기 중인 생산자를 깨워 종료시킨 뒤 기다림
+        stop.set()
+        slots.release()
+        await asyncio.gather(worker, return_exceptions=True)
+
+
+def iter_pdf_pages(file_path: str) -> Iterator[Dict[str, Any]]:
+    """Yield page chunks of a PDF (runs entirely in one worker thread)."""
+    import fitz  # PyMuPDF
+
+    # 확장자/내용 추측 없이 PDF로 바로 연다
+    doc = fitz.open(file_path, filetype='pdf')
+    try:
+        total_pages = len(doc)
+        for page_num in range(total_pages):
+            page = doc[page_num]
+            # 콘텐츠 스트림이 없는 빈 페이지는 레이아웃 분석을 건너뜀
+            text = page.get_text() if page.get_contents() else ""
+            yield {
+                "type": "page",
+                "page_number": page_num + 1,
+                "total_pages": total_pages,
+                "content": text,
+                "progress": ((page_num + 1) / total_pages) * 100
+            }
+    finally:
+        doc.close()
+
+
+def _iter_mmap_progress(mm: mmap.mmap, total_size: int, chunk_size: int) -> Iterator[Dict[str, Any]]:
+    """Yield progress chunks for a mapped file while paging it in.
+
+    파일 전체를 먼저 선적재한 뒤 진행률 루프를 다시 도는 대신, 청크 구간을
+    MADV_POPULATE_READ로 채운 직후 그 진행률을 내보내 매핑을 한 번만
+    훑는다. 진행률은 실제로 읽힌 양을 반영한다.
+    """
+    for offset in range(0, total_size, chunk_size):
+        end = min(offset + chunk_size, total_size)
+        # 현재 청크를 채우는 동안 다음 청크의 비동기 readahead를 걸어 둠
+        if end < total_size:
+            _madvise(mm, 'MADV_WILLNEED', end, min(chunk_size, total_size - end))
+        _madvise(mm, 'MADV_POPULATE_READ', offset, end - offset)
+
+        # Process chunk (simplified - actual implementation would parse properly)
+        yield {
+            "type": "content_chunk",
+            "offset": offset,
+            "size": end - offset,
+            "total_size": total_size,
+            "progress": (end / total_size) * 100
+        }
+
+
+def _iter_text_chunks(file_path: str, file_size: int, chunk_size: int) -> Iterator[Dict[str, Any]]:
+    """Yield decoded text chunks of a UTF-8 file via mmap."""
+    if file_size == 0:
+        return
+
+    fd = os.open(file_path, os.O_RDONLY)
+    try:
+        _advise_sequential(fd)
+        with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+            _madvise(mm, 'MADV_SEQUENTIAL', 0, file_size)
+            # 청크 경계에서 잘린 멀티바이트 문자는 다음 청크와 이어서 디코딩
+            decoder = codecs.getincrementaldecoder('utf-8')(errors='ignore')
+
+            for offset in range(0, file_size, chunk_size):
+                end = min(offset + chunk_size, file_size)
+                with view[offset:end] as piece:
+                    chunk = decoder.decode(piece)
+                if not chunk:
+                    continue
+
+                yield {
+                    "type": "text_chunk",
+                    "content": chunk,
+                    "progress": (end / file_size) * 100
+                }
+    finally:
+        os.close(fd)
+
+
+def _adaptive_chunk_size(base: int, size: int, block_size: int = 4096) -> int:
+    """Scale chunk size with data size (~1/1024) and align to block_size."""
+    chunk = max(base, min(MAX_ADAPTIVE_CHUNK, max(MIN_ADAPTIVE_CHUNK, size // 1024)))
+    return -(-chunk // block_size) * block_size
+
+
+def _write_at(fd: int, buffers: List[bytes], offset: int) -> None:
+    """Write buffers contiguously starting at offset, handling short writes."""
+    views = [memoryview(buf) for buf in buffers if buf]
+    if not hasattr(os, 'pwritev'):
+        os.lseek(fd, offset, os.SEEK_SET)
+        for view in views:
+            while view:
+                view = view[os.write(fd, view):]
+        return
+
+    while views:
+        written = os.pwritev(fd, views, offset)
+        offset += written
+        # 완전히 기록된 버퍼는 버리고, 부분 기록된 버퍼는 남은 부분만 유지
+        while views and written >= len(views[0]):
+            written -= len(views[0])
+            views.pop(0)
+        if written:
+            views[0] = views[0][written:]
+
 
 class StreamParser:
     """
@@ -36,21 +232,17 @@ class StreamParser:
             with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp:
                 temp_file_path = tmp.name
             
-            # Stream file content to disk with size check
-            bytes_written = 0
-            async with aiofiles.open(temp_file_path, 'wb') as f:
-                async for chunk in file_stream:
-                    if bytes_written + len(chunk) > self.max_file_size:
-                        raise FileTooLargeError(f"File exceeds maximum size of {self.max_file_size / 1024 / 1024:.0f}MB")
-                    
-                    await f.write(chunk)
-                    bytes_written += len(chunk)
-                    
-                    # Log progress for large files
-                    if bytes_written % (10 * 1024 * 1024) == 0:  # Every 10MB
-                        logger.info(f"Streaming file: {bytes_written / 1024 / 1024:.1f} MB written")
+            fd = os.open(temp_file_path, os.O_WRONLY | getattr(os, 'O_BINARY', 0))
+            try:
+                if isinstance(file_stream, os.PathLike) or regular_file_fd(file_stream) is not None:
+                    # 디스크 파일이 입력이면 커널 내 복사로 유저 공간을 거치지 않음
+                    bytes_written = await asyncio.to_thread(self._copy_from_file, file_stream, fd)
+                else:
+                    bytes_written = await self._write_stream(file_stream, fd)
+            finally:
+                os.close(fd)
             
-            logger.info(f"File saved: {bytes_written / 1024 / 1024:.2f} MB total")
+            logger.info("File saved", bytes=bytes_written)
             yield temp_file_path
             
         finally:
@@ -59,7 +251,76 @@ class StreamParser:
                 try:
                     os.unlink(temp_file_path)
                 except Exception as e:
-                    logger.warning(f"Failed to delete temp file: {e}")
+                    logger.warning("Failed to delete temp file", error=str(e))
+    
+    async def _write_stream(self, file_stream, fd: int) -> int:
+        """Write an async chunk stream to fd with size check; returns bytes written."""
+        # 청크마다 스레드 왕복하지 않도록 WRITE_BATCH_CHUNKS개씩 모아
+        # 한 번의 pwritev 호출로 기록하고, 기록이 진행되는 동안 다음
+        # 청크를 계속 수신하도록 최대 MAX_INFLIGHT_WRITES개까지 겹쳐 실행
+        bytes_written = 0
+        next_log_at = PROGRESS_LOG_INTERVAL
+        pending = deque()
+        try:
+            batch = []
+            batch_bytes = 0
+            batch_offset = 0
+            async for chunk in file_stream:
+                if bytes_written + len(chunk) > self.max_file_size:
+                    raise FileTooLargeError(f"File exceeds maximum size of {self.max_file_size / 1024 / 1024:.0f}MB")
+                
+                batch.append(chunk)
+                batch_bytes += len(chunk)
+                bytes_written += len(chunk)
+                # 업로드 전체 크기는 미리 알 수 없으므로 지금까지 받은 크기에
+                # 비례해 배치 목표 크기를 키움 (readahead 창을 늘리는 방식)
+                if (len(batch) >= WRITE_BATCH_CHUNKS
+                        or batch_bytes >= _adaptive_chunk_size(self.chunk_size, bytes_written)):
+                    pending.append(asyncio.create_task(
+                        asyncio.to_thread(_write_at, fd, batch, batch_offset)
+                    ))
+                    batch = []
+                    batch_bytes = 0
+                    batch_offset = bytes_written
+                    if len(pending) >= MAX_INFLIGHT_WRITES:
+                        await pending.popleft()
+                
+                # Log progress for large files - 청크 크기가 가변이라 나머지 0
+                # 비교로는 경계를 놓치므로 다음 임계값을 넘을 때 기록
+                if bytes_written >= next_log_at:
+                    logger.info("Streaming file", mb=bytes_written >> 20)
+                    next_log_at = (bytes_written // PROGRESS_LOG_INTERVAL + 1) * PROGRESS_LOG_INTERVAL
+            
+            if batch:
+                pending.append(asyncio.create_task(
+                    asyncio.to_thread(_write_at, fd, batch, batch_offset)
+                ))
+            while pending:
+                await pending.popleft()
+        finally:
+            # 오류로 빠져나온 경우에도 진행 중인 기록이 끝난 뒤 fd를 닫도록 대기
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+        
+        return bytes_written
+    
+    def _copy_from_file(self, source, fd: int) -> int:
+        """Copy a path or regular disk file object into fd in-kernel; returns bytes copied."""
+        if isinstance(source, os.PathLike):
+            with open(source, 'rb') as f:
+                return self._copy_from_file(f, fd)
+        
+        src_fd = source.fileno()
+        # 버퍼가 있는 파일 객체는 fd 위치보다 논리 위치(tell)가 정확함
+        start = source.tell()
+        size = os.fstat(src_fd).st_size - start
+        if size > self.max_file_size:
+            raise FileTooLargeError(f"File exceeds maximum size of {self.max_file_size / 1024 / 1024:.0f}MB")
+        
+        copied = copy_fd_range(src_fd, fd, start, size)
+        # 파일 객체의 위치를 복사한 만큼 옮겨 일반 read()와 같은 상태로 맞춤
+        source.seek(start + copied)
+        return copied
     
     async def parse_file_chunks(self, file_path: str, file_type: str) -> AsyncIterator[Dict[str, Any]]:
         """
@@ -69,7 +330,7 @@ class StreamParser:
             Parsed content chunks
         """
         file_size = os.path.getsize(file_path)
-        logger.info(f"Starting chunked parsing: {file_size / 1024 / 1024:.2f} MB, type: {file_type}")
+        logger.info("Starting chunked parsing", bytes=file_size, file_type=file_type)
         
         # File info chunk
         yield {
@@ -86,65 +347,65 @@ class StreamParser:
             async for chunk in self._parse_medium_file_mmap(file_path, file_type):
                 yield chunk
         else:  # >= 100MB - stream processing
-            async for chunk in self._parse_large_file_stream(file_path, file_type):
+            async for chunk in self._parse_large_file_stream(file_path, file_type, file_size):
                 yield chunk
     
     async def _parse_small_file(self, file_path: str, file_type: str) -> Dict[str, Any]:
         """Parse small files entirely in memory"""
         try:
-            with open(file_path, 'rb') as f:
-                content = f.read()
-            
-            # Use existing text extractor
-            result = await asyncio.to_thread(
-                self.text_extractor.extract_text,
-                content,
-                file_type,
-                output_format='json'
-            )
+            # 파일 읽기도 추출과 함께 스레드에서 수행 (이벤트 루프 블록 방지)
+            result = await asyncio.to_thread(self._read_and_extract, file_path, file_type)
             
             return {
                 "type": "content",
                 "data": result
             }
         except Exception as e:
-            logger.error(f"Failed to parse small file: {e}")
+            logger.error("Failed to parse small file", error=str(e))
             raise ProcessingError(f"Failed to parse file: {str(e)}")
     
+    def _read_and_extract(self, file_path: str, file_type: str) -> Dict[str, Any]:
+        """Parse the file and build structured content (called in a worker thread)."""
+        if file_type == 'txt':
+            # 일반 텍스트는 파서 없이 디코딩
+            with open(file_path, 'rb') as f:
+                content = {"text": f.read().decode('utf-8', errors='ignore')}
+        else:
+            # HWP/HWPX/PDF 파서는 경로에서 직접 읽음 (형식은 확장자로 판별)
+            content = get_parser().parse(file_path)
+        
+        # Use existing text extractor
+        return self.text_extractor.extract_structured(content)
+    
     async def _parse_medium_file_mmap(self, file_path: str, file_type: str) -> AsyncIterator[Dict[str, Any]]:
         """Parse medium files using memory-mapped I/O"""
         try:
             with open(file_path, 'rb') as f:
+                _advise_sequential(f.fileno())
                 # Use memory mapping for efficient access
                 with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mmapped_file:
                     # Process in chunks
                     total_size = len(mmapped_file)
-                    chunk_size = 5 * 1024 * 1024  # 5MB chunks
-                    
-                    for offset in range(0, total_size, chunk_size):
-                        end = min(offset + chunk_size, total_size)
-                        chunk_data = mmapped_file[offset:end]
-                        
-                        # Process chunk (simplified - actual implementation would parse properly)
-                        yield {
-                            "type": "content_chunk",
-                            "offset": offset,
-                            "size": end - offset,
-                            "total_size": total_size,
-                            "progress": (end / total_size) * 100
-                        }
+                    chunk_size = 5 * 1024 * 1024  # 5MB chunks (페이지 정렬됨)
+                    _madvise(mmapped_file, 'MADV_SEQUENTIAL', 0, total_size)
+
+                    # 추출을 먼저 백그라운드 스레드에서 시작하고 진행률 청크를
+                    # 내보내는 동안 겹쳐 실행 (I/O 후 추출을 직렬로 기다리지 않음).
+                    # 파서는 경로에서 읽으므로 매핑이 채운 페이지 캐시를 그대로 사용
+                    extract_task = asyncio.create_task(asyncio.to_thread(
+                        self._read_and_extract, file_path, file_type
+                    ))
+                    try:
+                        async for chunk in _iterate_in_thread(
+                            _iter_mmap_progress, mmapped_file, total_size, chunk_size
+                        ):
+                            yield chunk
                         
-                        # Allow other tasks to run
-                        await asyncio.sleep(0)
-                    
-                    # Final processing
-                    mmapped_file.seek(0)
-                    result = await asyncio.to_thread(
-                        self.text_extractor.extract_text,
-                        bytes(mmapped_file),
-                        file_type,
-                        output_format='json'
-                    )
+                        # Final processing
+                        result = await extract_task
+                    finally:
+                        # 스레드는 취소할 수 없으므로 소비자가 중간에 끊어도 추출이 끝날 때까지 대기
+                        await asyncio.gather(extract_task, return_exceptions=True)
                     
                     yield {
                         "type": "final_content",
@@ -152,57 +413,40 @@ class StreamParser:
                     }
                     
         except Exception as e:
-            logger.error(f"Failed to parse medium file with mmap: {e}")
+            logger.error("Failed to parse medium file with mmap", error=str(e))
             raise ProcessingError(f"Failed to parse file: {str(e)}")
     
-    async def _parse_large_file_stream(self, file_path: str, file_type: str) -> AsyncIterator[Dict[str, Any]]:
+    async def _parse_large_file_stream(self, file_path: str, file_type: str, file_size: int) -> AsyncIterator[Dict[str, Any]]:
         """Parse very large files using streaming"""
         try:
             # For very large files, we need specialized streaming parsers
             # This is a simplified implementation
-            
-            if file_type == 'pdf':
-                async for chunk in self._stream_pdf(file_path):
-                    yield chunk
-            elif file_type in ['hwp', 'hwpx']:
-                async for chunk in self._stream_hwp(file_path):
-                    yield chunk
+            streamer = _LARGE_FILE_STREAMERS.get(file_type)
+            if streamer is not None:
+                chunks = streamer(self, file_path)
             else:
                 # Fallback to chunked text extraction
-                async for chunk in self._stream_text(file_path):
-                    yield chunk
+                chunks = self._stream_text(file_path, file_size)
+            
+            async for chunk in chunks:
+                yield chunk
                     
         except Exception as e:
-            logger.error(f"Failed to parse large file stream: {e}")
+            logger.error("Failed to parse large file stream", error=str(e))
             raise ProcessingError(f"Failed to parse file: {str(e)}")
     
     async def _stream_pdf(self, file_path: str) -> AsyncIterator[Dict[str, Any]]:
-        """Stream PDF content page by page"""
-        import fitz  # PyMuPDF
-        
+        """Stream PDF content page by page
+
+        PyMuPDF 문서 객체는 스레드 안전하지 않으므로 문서 열기부터 닫기까지
+        하나의 워커 스레드에서 수행하고, 큐를 통해 페이지 순서대로 받는다.
+        """
         try:
-            doc = fitz.open(file_path)
-            total_pages = len(doc)
-            
-            for page_num in range(total_pages):
-                page = doc[page_num]
-                text = page.get_text()
-                
-                yield {
-                    "type": "page",
-                    "page_number": page_num + 1,
-                    "total_pages": total_pages,
-                    "content": text,
-                    "progress": ((page_num + 1) / total_pages) * 100
-                }
-                
-                # Allow other tasks to run
-                await asyncio.sleep(0)
-            
-            doc.close()
+            async for chunk in _iterate_in_thread(iter_pdf_pages, file_path):
+                yield chunk
             
         except Exception as e:
-            logger.error(f"Failed to stream PDF: {e}")
+            logger.error("Failed to stream PDF", error=str(e))
             raise
     
     async def _stream_hwp(self, file_path: str) -> AsyncIterator[Dict[str, Any]]:
@@ -211,61 +455,58 @@ class StreamParser:
         # For now, we'll use the regular parser with chunking
         
         try:
-            with open(file_path, 'rb') as f:
-                content = f.read()
-            
             # Extract in chunks (simplified)
-            result = await asyncio.to_thread(
-                self.text_extractor.extract_text,
-                content,
-                'hwp',
-                output_format='json'
-            )
+            result = await asyncio.to_thread(self._read_and_extract, file_path, 'hwp')
             
             # Yield as chunks
-            if isinstance(result, dict) and 'content' in result:
-                content_str = str(result['content'])
+            if isinstance(result, dict) and 'text' in result:
+                content_str = result['text']
+                if not isinstance(content_str, str):
+                    content_str = str(content_str)
+                total_chars = len(content_str)
                 chunk_size = 10000  # characters
                 
-                for i in range(0, len(content_str), chunk_size):
+                # 청크마다 필요한 슬라이스만 만들고 길이/진행률 계산은 한 번만
+                for i in range(0, total_chars, chunk_size):
+                    end = min(i + chunk_size, total_chars)
                     yield {
                         "type": "text_chunk",
                         "offset": i,
-                        "content": content_str[i:i+chunk_size],
-                        "progress": (min(i + chunk_size, len(content_str)) / len(content_str)) * 100
+                        "content": content_str[i:end],
+                        "progress": (end / total_chars) * 100
                     }
-                    await asyncio.sleep(0)
                     
         except Exception as e:
-            logger.error(f"Failed to stream HWP: {e}")
+            logger.error("Failed to stream HWP", error=str(e))
             raise
     
-    async def _stream_text(self, file_path: str) -> AsyncIterator[Dict[str, Any]]:
-        """Stream plain text content"""
+    async def _stream_text(self, file_path: str, file_size: Optional[int] = None) -> AsyncIterator[Dict[str, Any]]:
+        """Stream plain text content
+
+        파일을 mmap으로 매핑하고 chunk_size 바이트 구간마다 증분 UTF-8
+        디코더로 디코딩해 내보낸다 (디코딩은 워커 스레드에서 수행).
+        """
         try:
-            file_size = os.path.getsize(file_path)
-            bytes_read = 0
-            
-            async with aiofiles.open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                while True:
-                    chunk = await f.read(self.chunk_size)
-                    if not chunk:
-                        break
-                    
-                    bytes_read += len(chunk.encode('utf-8'))
-                    
-                    yield {
-                        "type": "text_chunk",
-                        "content": chunk,
-                        "progress": (bytes_read / file_size) * 100
-                    }
-                    
-                    await asyncio.sleep(0)
+            if file_size is None:
+                file_size = os.path.getsize(file_path)
+            chunk_size = self._read_chunk_size(file_path, file_size)
+            async for chunk in _iterate_in_thread(_iter_text_chunks, file_path, file_size, chunk_size):
+                yield chunk
                     
         except Exception as e:
-            logger.error(f"Failed to stream text: {e}")
+            logger.error("Failed to stream text", error=str(e))
             raise
     
+    def _read_chunk_size(self, file_path: str, file_size: int) -> int:
+        """Read chunk size for file_path, aligned to the filesystem block size."""
+        block_size = 4096
+        if hasattr(os, 'statvfs'):
+            try:
+                block_size = os.statvfs(file_path).f_bsize or block_size
+            except OSError:
+                pass
+        return _adaptive_chunk_size(self.chunk_size, file_size, block_size)
+    
     async def extract_text_stream(self, file_path: str, file_type: str) -> AsyncIterator[str]:
         """
         Extract text from file using streaming
@@ -274,10 +515,17 @@ class StreamParser:
             Text chunks
         """
         async for chunk in self.parse_file_chunks(file_path, file_type):
-            if chunk['type'] == 'text_chunk':
-                yield chunk['content']
-            elif chunk['type'] == 'page':
+            chunk_type = chunk['type']
+            if chunk_type in _TEXT_CHUNK_TYPES:
                 yield chunk['content']
-            elif chunk['type'] == 'final_content':
+            elif chunk_type in ('content', 'final_content'):
                 if isinstance(chunk['data'], dict) and 'text' in chunk['data']:
-                    yield chunk['data']['text']
\ No newline at end of file
+                    yield chunk['data']['text']
+
+
+# 100MB 이상 파일의 형식별 스트리머 (호출마다 if/elif 체인을 타지 않도록)
+_LARGE_FILE_STREAMERS = {
+    'pdf': StreamParser._stream_pdf,
+    'hwp': StreamParser._stream_hwp,
+    'hwpx': StreamParser._stream_hwp,
+}
\ No newline at end of file
@@ -3,6 +3,7 @@ Text Extractor Service for structured content extraction.
 Optimized for AI analysis and processing.
 """
 import structlog
+from dataclasses import dataclass
 from typing import Dict, Any, List, Optional
 import re
 from datetime import datetime, timezone
@@ -10,6 +11,82 @@ import json
 
 logger = structlog.get_logger()
 
+# 문단마다 패턴 문자열로 re 캐시를 조회하지 않도록 모듈 로드 시 한 번 컴파일
+_ROMAN_NUMERALS = 'ⅠⅡⅢⅣⅤⅥⅦⅧⅨⅩⅪⅫⅰⅱⅲⅳⅴⅵⅶⅷⅸⅹ'
+
+# 제목 판별 패턴 (_is_heading)
+_HEADING_PATTERNS = [
+    re.compile(r'^제\s*\d+\s*[장절조항]'),  # 제1장, 제2절 등
+    re.compile(r'^\d+\.\s+'),  # 1. 2. 3.
+    re.compile(r'^[가-힣]\.\s+'),  # 가. 나. 다.
+    re.compile(r'^Chapter\s+\d+'),  # Chapter 1
+    re.compile(r'^Section\s+\d+'),  # Section 1
+    re.compile(rf'^<[{_ROMAN_NUMERALS}]+>'),  # <Ⅰ>, <Ⅱ> 등 로마 숫자
+    re.compile(rf'^[{_ROMAN_NUMERALS}]+\.'),  # Ⅰ. Ⅱ. 등
+    re.compile(rf'^[{_ROMAN_NUMERALS}]+\s+'),  # Ⅰ Ⅱ 등
+]
+# 모든 제목 패턴을 하나의 대안 패턴으로 합쳐 match 한 번으로 판별
+_HEADING_RE = re.compile('|'.join(f'(?:{p.pattern})' for p in _HEADING_PATTERNS))
+
+# 제목 수준 패턴 (_get_heading_level) - 순서대로 검사해 처음 일치한 수준 사용
+_HEADING_LEVEL_PATTERNS = [
+    (re.compile(r'^제\s*\d+\s*장'), 1),
+    (re.compile(r'^제\s*\d+\s*절'), 2),
+    (re.compile(r'^<[ⅠⅡⅢⅣⅤⅥⅦⅧⅨⅩⅪⅫ]+>'), 1),  # 대문자 로마 숫자
+    (re.compile(r'^[ⅠⅡⅢⅣⅤⅥⅦⅧⅨⅩⅪⅫ]+\.'), 1),  # 대문자 로마 숫자 with period
+    (re.compile(r'^<[ⅰⅱⅲⅳⅴⅵⅶⅷⅸⅹ]+>'), 2),  # 소문자 로마 숫자
+    (re.compile(r'^\d+\.\s+'), 2),
+    (re.compile(r'^[가-힣]\.\s+'), 3),
+]
+# 대안은 앞에서부터 시도되므로 lastgroup이 처음 일치한 패턴을 가리킴
+_HEADING_LEVEL_RE = re.compile('|'.join(
+    f'(?P<g{i}>{pattern.pattern})' for i, (pattern, _) in enumerate(_HEADING_LEVEL_PATTERNS)
+))
+_HEADING_LEVEL_BY_GROUP = {f'g{i}': level for i, (_, level) in enumerate(_HEADING_LEVEL_PATTERNS)}
+
+# 제목 종류 패턴 (_classify_heading)
+_LEGAL_HEADING_RE = _HEADING_PATTERNS[0]
+_ACADEMIC_HEADING_RE = re.compile(r'^Chapter|Section', re.I)
+
+# 목록 패턴
+# 목록 기호 종류를 이름 붙은 그룹으로 구분해 match 한 번으로 접두어 범위와 종류를 얻음
+_LIST_COMBINED = re.compile(
+    r'^[\s]*(?:(?P<ordered>\d+[\.\)])|(?P<korean_ordered>[가-힣][\.\)])|(?P<unordered>[•·▪▫◦‣⁃\-\*]))\s*'
+)
+_LIST_BULLET_RE = re.compile(r'^[\s]*[•·▪▫◦‣⁃\-\*]\s+')
+_LIST_NUM_RE = re.compile(r'^[\s]*\d+[\.\)]\s+')
+
+# 의미 태그 패턴 (_tag_paragraph)
+_DATE_RE = re.compile(r'\d{4}[-/년]\s*\d{1,2}[-/월]\s*\d{1,2}')
+_EMAIL_RE = re.compile(r'[\w\.-]+@[\w\.-]+')
+_URL_RE = re.compile(r'https?://\S+')
+_PHONE_RE = re.compile(r'\d{2,3}-\d{3,4}-\d{4}')
+_CURRENCY_RE = re.compile(r'[₩$¥€£]\s*[\d,]+')
+
+# <> 구분 표 셀 (_parse_table_from_text) - 짝 없는 '>'도 토큰으로 잡음
+_TABLE_CELL_RE = re.compile(r'<([^<>]*)>|>')
+
+# 통계 패턴 (_calculate_statistics)
+# 글자마다 1글자 문자열을 만들지 않도록 연속 구간 단위로 일치시켜 길이를 합산
+_KOREAN_RUN_RE = re.compile(r'[가-힣]+')
+_ENGLISH_RUN_RE = re.compile(r'[a-zA-Z]+')
+_SENTENCE_SPLIT_RE = re.compile(r'[.!?]+')
+
+
+@dataclass(slots=True)
+class _ParagraphView:
+    """Paragraph fields normalized once and shared by every builder."""
+    index: int
+    text: Any
+    style: Dict[str, Any]
+    is_dict: bool
+    # 빌더들이 공유하는 분류 결과 (_walk_paragraphs에서 한 번만 계산)
+    is_heading: bool = False
+    heading_level: int = 0
+    classification: str = "normal"
+    tags: Optional[List[str]] = None
+    word_count: int = 0
+
 
 class TextExtractor:
     """
@@ -21,7 +98,8 @@ class TextExtractor:
         parsed_content: Dict[str, Any],
         include_metadata: bool = True,
         include_structure: bool = True,
-        include_statistics: bool = True
+        include_statistics: bool = True,
+        include_text: bool = True
     ) -> Dict[str, Any]:
         """
         Extract structured content from parsed HWP data.
@@ -31,6 +109,7 @@ class TextExtractor:
             include_metadata: Include document metadata
             include_structure: Preserve document structure
             include_statistics: Include text statistics
+            include_text: Include joined plain text
             
         Returns:
             Structured content dictionary
@@ -44,20 +123,38 @@ class TextExtractor:
         if include_metadata:
             result["metadata"] = self._extract_metadata(parsed_content)
         
+        # 평문은 통계 계산에도 필요하므로 둘 중 하나라도 요청되면 만듦
+        build_text = include_text or include_statistics
+        if not (include_structure or build_text):
+            # 메타데이터만 요청된 경우 문단 순회 자체를 생략
+            return result
+        
+        # 문단 목록을 한 번만 순회해 text/style 정규화와 분류를 끝내고
+        # 모든 빌더가 결과를 공유 (구조를 만들지 않으면 분류는 생략)
+        views = self._walk_paragraphs(
+            parsed_content.get("paragraphs", []),
+            detect_headings=include_structure,
+            annotate=include_structure
+        )
+        
         # Extract main content
         if include_structure:
-            result["structure"] = self._extract_structure(parsed_content)
-            result["paragraphs"] = self._extract_paragraphs(parsed_content)
-            result["tables"] = self._extract_tables(parsed_content)
-            result["lists"] = self._extract_lists(parsed_content)
-            result["headings"] = self._extract_headings(parsed_content)
-        
-        # Extract plain text
-        result["text"] = self._extract_plain_text(parsed_content)
-        
-        # Calculate statistics
-        if include_statistics:
-            result["statistics"] = self._calculate_statistics(result)
+            result["structure"] = self._build_structure(views)
+            result["paragraphs"] = self._build_paragraphs(views)
+            result["tables"] = self._extract_tables(parsed_content, views)
+            result["lists"] = self._build_lists(views)
+            result["headings"] = self._build_headings(views)
+        
+        if build_text:
+            # Extract plain text - 통계가 필요하면 조각을 모으는 동안 글자/단어 수를 함께 셈
+            text_counts = self._new_text_counts() if include_statistics else None
+            text = self._extract_plain_text(parsed_content, views, text_counts)
+            if include_text:
+                result["text"] = text
+            
+            # Calculate statistics
+            if include_statistics:
+                result["statistics"] = self._calculate_statistics(result, text_counts, text)
         
         return result
     
@@ -78,7 +175,46 @@ class TextExtractor:
             "page_count": metadata.get("page_count", 0),
         }
     
-    def _extract_structure(self, content: Dict[str, Any]) -> Dict[str, Any]:
+    def _walk_paragraphs(
+        self,
+        paragraphs: List[Any],
+        detect_headings: bool = True,
+        annotate: bool = True
+    ) -> List[_ParagraphView]:
+        """
+        Normalize raw paragraphs (dict or legacy str) into views in one pass.
+        
+        Args:
+            paragraphs: Raw paragraph list from parsed content
+            detect_headings: Compute heading flag and level
+            annotate: Compute paragraph type and semantic tags
+            
+        Returns:
+            List of paragraph views
+        """
+        views = []
+        for i, para in enumerate(paragraphs):
+            if isinstance(para, dict):
+                view = _ParagraphView(i, para.get("text", ""), para.get("style", {}), True)
+            else:
+                view = _ParagraphView(i, para, {}, False)
+            
+            if detect_headings or annotate:
+                view.is_heading = self._is_heading(view.text, view.style)
+                if view.is_heading:
+                    view.heading_level = self._get_heading_level(view.text, view.style)
+            
+            if annotate and (view.is_dict or isinstance(view.text, str)):
+                if view.is_dict:
+                    view.classification = self._classify_paragraph(view.text, view.is_heading)
+                # 단어 수는 문단 목록과 길이 태그가 함께 쓰므로 split은 한 번만
+                view.word_count = len(view.text.split())
+                view.tags = self._tag_paragraph(view.text, view.word_count)
+            
+            views.append(view)
+        return views
+    
+    def _build_structure(self, views: List[_ParagraphView]) -> Dict[str, Any]:
         """Extract document structure information."""
         structure = {
             "type": "document",
@@ -86,82 +222,83 @@ class TextExtractor:
             "hierarchy": []
         }
         
-        # Analyze document structure
-        paragraphs = content.get("paragraphs", [])
-        current_section = None
+        # Analyze document structure - 평면 목록과 트리를 같은 스택 순회에서 함께 구성
         section_stack = []
         
-        for i, para in enumerate(paragraphs):
-            if isinstance(para, dict):
-                para_text = para.get("text", "")
-                para_style = para.get("style", {})
-                
+        for view in views:
+            if view.is_dict:
                 # Detect headings based on style or pattern
-                if self._is_heading(para_text, para_style):
-                    level = self._get_heading_level(para_text, para_style)
+                if view.is_heading:
+                    level = view.heading_level
                     section = {
                         "type": "heading",
                         "level": level,
-                        "text": para_text,
-                        "index": i
+                        "text": view.text,
+                        "index": view.index
+                    }
+                    node = {
+                        "text": view.text,
+                        "level": level,
+                        "index": view.index,
+                        "children": []
                     }
                     
                     # Update hierarchy
-                    while section_stack and section_stack[-1]["level"] >= level:
+                    while section_stack and section_stack[-1][0]["level"] >= level:
                         section_stack.pop()
                     
                     if section_stack:
-                        section["parent"] = section_stack[-1]["index"]
+                        parent, parent_node = section_stack[-1]
+                        section["parent"] = parent["index"]
+                        parent_node["children"].append(node)
+                    else:
+                        structure["hierarchy"].append(node)
                     
-                    section_stack.append(section)
+                    section_stack.append((section, node))
                     structure["sections"].append(section)
         
-        # Build hierarchy tree
-        structure["hierarchy"] = self._build_hierarchy(structure["sections"])
-        
         return structure
     
-    def _extract_paragraphs(self, content: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def _build_paragraphs(self, views: List[_ParagraphView]) -> List[Dict[str, Any]]:
         """Extract paragraphs with context."""
         paragraphs = []
-        raw_paragraphs = content.get("paragraphs", [])
         
-        for i, para in enumerate(raw_paragraphs):
-            if isinstance(para, dict):
+        for view in views:
+            text = view.text
+            if view.is_dict:
                 para_dict = {
-                    "index": i,
-                    "text": para.get("text", ""),
-                    "type": self._classify_paragraph(para),
-                    "style": para.get("style", {}),
-                    "char_count": len(para.get("text", "")),
-                    "word_count": len(para.get("text", "").split()),
+                    "index": view.index,
+                    "text": text,
+                    "type": view.classification,
+                    "style": view.style,
+                    "char_count": len(text),
+                    "word_count": view.word_count,
                 }
                 
                 # Add semantic tags
-                para_dict["tags"] = self._tag_paragraph(para_dict["text"])
+                para_dict["tags"] = view.tags
                 
                 paragraphs.append(para_dict)
-            elif isinstance(para, str):
+            elif isinstance(text, str):
                 paragraphs.append({
-                    "index": i,
-                    "text": para,
+                    "index": view.index,
+                    "text": text,
                     "type": "normal",
-                    "char_count": len(para),
-                    "word_count": len(para.split()),
-                    "tags": self._tag_paragraph(para)
+                    "char_count": len(text),
+                    "word_count": view.word_count,
+                    "tags": view.tags
                 })
         
         return paragraphs
     
-    def _extract_tables(self, content: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def _extract_tables(self, content: Dict[str, Any], views: List[_ParagraphView]) -> List[Dict[str, Any]]:
         """Extract tables with structure preserved."""
         tables = []
         raw_tables = content.get("tables", [])
         
         # Also check for tables in paragraphs (HWP format with <> delimiters)
-        paragraphs = content.get("paragraphs", [])
-        for para in paragraphs:
-            text = para.get("text", "") if isinstance(para, dict) else para
+        for view in views:
+            text = view.text
             if self._is_table_text(text):
                 parsed_table = self._parse_table_from_text(text)
                 if parsed_table:
@@ -185,17 +322,19 @@ class TextExtractor:
                 for row_idx, row in enumerate(rows):
                     if row:
                         table_dict["col_count"] = max(table_dict["col_count"], len(row))
-                        processed_row = []
+                        processed_row = list(map(str, row))
                         
-                        for col_idx, cell in enumerate(row):
-                            cell_data = {
+                        # 셀 종류는 위치(첫 행/첫 열)로만 정해지므로 행마다 한 번만 분류
+                        first_type = self._classify_cell(row[0], row_idx, 0)
+                        rest_type = self._classify_cell(None, row_idx, 1)
+                        cells = table_dict["cells"]
+                        for col_idx, text in enumerate(processed_row):
+                            cells.append({
                                 "row": row_idx,
                                 "col": col_idx,
-                                "text": str(cell),
-                                "type": self._classify_cell(cell, row_idx, col_idx)
-                            }
-                            processed_row.append(cell_data["text"])
-                            table_dict["cells"].append(cell_data)
+                                "text": text,
+                                "type": rest_type if col_idx else first_type
+                            })
                         
                         table_dict["rows"].append(processed_row)
                 
@@ -206,29 +345,30 @@ class TextExtractor:
         
         return tables
     
-    def _extract_lists(self, content: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def _build_lists(self, views: List[_ParagraphView]) -> List[Dict[str, Any]]:
         """Extract lists from content."""
         lists = []
-        paragraphs = content.get("paragraphs", [])
         
         current_list = None
-        list_pattern = re.compile(r'^[\s]*[•·▪▫◦‣⁃\-\*]\s*|^[\s]*\d+[\.\)]\s*|^[\s]*[가-힣][\.\)]\s*')
         
-        for i, para in enumerate(paragraphs):
-            text = para.get("text", "") if isinstance(para, dict) else para
+        for view in views:
+            i = view.index
+            text = view.text
+            match = _LIST_COMBINED.match(text)
             
-            if list_pattern.match(text):
+            if match:
                 # This is a list item
                 if not current_list:
                     current_list = {
-                        "type": self._detect_list_type(text),
+                        "type": self._detect_list_type(match),
                         "items": [],
                         "start_index": i
                     }
                 
+                # 접두어는 항상 0번 위치에서 일치하므로 sub 대신 잘라냄
                 current_list["items"].append({
-                    "text": list_pattern.sub('', text).strip(),
-                    "level": self._detect_list_level(text),
+                    "text": text[match.end():].strip(),
+                    "level": self._detect_list_level(match),
                     "index": len(current_list["items"]),
                     "original": text
                 })
@@ -241,41 +381,52 @@ class TextExtractor:
         
         # Handle list at end of document
         if current_list:
-            current_list["end_index"] = len(paragraphs) - 1
+            current_list["end_index"] = len(views) - 1
             lists.append(current_list)
         
         return lists
     
-    def _extract_headings(self, content: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def _build_headings(self, views: List[_ParagraphView]) -> List[Dict[str, Any]]:
         """Extract headings with hierarchy."""
         headings = []
-        paragraphs = content.get("paragraphs", [])
         
-        for i, para in enumerate(paragraphs):
-            text = para.get("text", "") if isinstance(para, dict) else para
-            style = para.get("style", {}) if isinstance(para, dict) else {}
-            
-            if self._is_heading(text, style):
+        for view in views:
+            if view.is_heading:
+                text = view.text
                 headings.append({
                     "text": text,
-                    "level": self._get_heading_level(text, style),
-                    "index": i,
+                    "level": view.heading_level,
+                    "index": view.index,
                     "type": self._classify_heading(text)
                 })
         
         return headings
     
-    def _extract_plain_text(self, content: Dict[str, Any]) -> str:
-        """Extract plain text for simple analysis."""
+    def _extract_plain_text(
+        self,
+        content: Dict[str, Any],
+        views: List[_ParagraphView],
+        text_counts: Optional[Dict[str, int]] = None
+    ) -> str:
+        """
+        Extract plain text for simple analysis.
+        
+        Args:
+            content: Parsed content
+            views: Paragraph views from _walk_paragraphs
+            text_counts: If given, accumulate counters of the joined text into it
+            
+        Returns:
+            Paragraph, table and raw text joined by blank lines
+        """
+        # 빈 조각은 모은 뒤 다시 거르지 않고 추가할 때 바로 제외
         text_parts = []
         
         # From paragraphs
-        paragraphs = content.get("paragraphs", [])
-        for para in paragraphs:
-            if isinstance(para, dict):
-                text_parts.append(para.get("text", ""))
-            else:
-                text_parts.append(str(para))
+        for view in views:
+            text = view.text if view.is_dict else str(view.text)
+            if text:
+                text_parts.append(text)
         
         # From tables (simplified)
         tables = content.get("tables", [])
@@ -283,26 +434,74 @@ class TextExtractor:
             if isinstance(table, dict):
                 rows = table.get("rows", [])
                 for row in rows:
-                    text_parts.append(" | ".join(str(cell) for cell in row))
+                    row_text = " | ".join(map(str, row))
+                    if row_text:
+                        text_parts.append(row_text)
         
         # From raw text if available
-        if "text" in content:
+        if content.get("text"):
             text_parts.append(content["text"])
         
-        return "\n\n".join(filter(None, text_parts))
+        if text_counts is not None and text_parts:
+            for part in text_parts:
+                self._count_text(part, text_counts)
+            # 조각 사이 구분자 "\n\n"
+            separator_chars = 2 * (len(text_parts) - 1)
+            text_counts["chars"] += separator_chars
+            text_counts["blanks"] += separator_chars
+            text_counts["newlines"] += separator_chars
+        
+        return "\n\n".join(text_parts)
+    
+    @staticmethod
+    def _new_text_counts() -> Dict[str, int]:
+        """Create zeroed text counters used by _count_text."""
+        return {"chars": 0, "blanks": 0, "newlines": 0, "words": 0, "korean": 0, "english": 0}
     
-    def _calculate_statistics(self, extracted_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Calculate text statistics for analysis."""
-        text = extracted_data.get("text", "")
+    @staticmethod
+    def _count_text(text: str, counts: Dict[str, int]) -> Dict[str, int]:
+        """Accumulate character, word and script counters of text into counts."""
+        newlines = text.count("\n")
+        counts["chars"] += len(text)
+        counts["blanks"] += text.count(" ") + newlines
+        counts["newlines"] += newlines
+        counts["words"] += len(text.split())
+        # 연속 구간 길이 합산 - ord() 루프는 글자마다 파이썬 반복이 돌아 더 느림
+        counts["korean"] += sum(map(len, _KOREAN_RUN_RE.findall(text)))
+        counts["english"] += sum(map(len, _ENGLISH_RUN_RE.findall(text)))
+        return counts
+    
+    def _calculate_statistics(
+        self,
+        extracted_data: Dict[str, Any],
+        text_counts: Optional[Dict[str, int]] = None,
+        text: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Calculate text statistics for analysis.
+        
+        Args:
+            extracted_data: Extraction result containing text and builders output
+            text_counts: Counters accumulated while building the text; computed
+                from the text when omitted
+            text: Plain text to analyze; defaults to extracted_data["text"]
+                
+        Returns:
+            Statistics dictionary
+        """
+        if text is None:
+            text = extracted_data.get("text", "")
         paragraphs = extracted_data.get("paragraphs", [])
         tables = extracted_data.get("tables", [])
+        if text_counts is None:
+            text_counts = self._count_text(text, self._new_text_counts())
         
         # Basic statistics
         stats = {
-            "char_count": len(text),
-            "char_count_no_spaces": len(text.replace(" ", "").replace("\n", "")),
-            "word_count": len(text.split()),
-            "line_count": text.count("\n") + 1,
+            "char_count": text_counts["chars"],
+            "char_count_no_spaces": text_counts["chars"] - text_counts["blanks"],
+            "word_count": text_counts["words"],
+            "line_count": text_counts["newlines"] + 1,
             "paragraph_count": len(paragraphs),
             "table_count": len(tables),
             "list_count": len(extracted_data.get("lists", [])),
@@ -310,25 +509,36 @@ class TextExtractor:
         }
         
         # Language detection (simple heuristic for Korean)
-        korean_chars = len(re.findall(r'[가-힣]', text))
-        english_chars = len(re.findall(r'[a-zA-Z]', text))
-        stats["korean_ratio"] = korean_chars / max(len(text), 1)
-        stats["english_ratio"] = english_chars / max(len(text), 1)
+        stats["korean_ratio"] = text_counts["korean"] / max(text_counts["chars"], 1)
+        stats["english_ratio"] = text_counts["english"] / max(text_counts["chars"], 1)
         
         # Sentence statistics
-        sentences = re.split(r'[.!?]+', text)
-        stats["sentence_count"] = len([s for s in sentences if s.strip()])
-        stats["avg_sentence_length"] = (
-            sum(len(s.split()) for s in sentences if s.strip()) / 
-            max(stats["sentence_count"], 1)
-        )
+        # 공백뿐인 조각은 단어가 0개이므로 split 한 번으로 판별과 집계를 함께 처리
+        sentence_count = 0
+        sentence_words = 0
+        for sentence in _SENTENCE_SPLIT_RE.split(text):
+            words = len(sentence.split())
+            if words:
+                sentence_count += 1
+                sentence_words += words
+        stats["sentence_count"] = sentence_count
+        stats["avg_sentence_length"] = sentence_words / max(sentence_count, 1)
         
         # Paragraph statistics
+        # 길이 목록을 따로 만들지 않고 합계/최대/최소를 한 번의 순회로 집계
         if paragraphs:
-            para_lengths = [p.get("word_count", 0) for p in paragraphs]
-            stats["avg_paragraph_length"] = sum(para_lengths) / len(para_lengths)
-            stats["max_paragraph_length"] = max(para_lengths)
-            stats["min_paragraph_length"] = min(para_lengths)
+            total = 0
+            longest = shortest = paragraphs[0].get("word_count", 0)
+            for p in paragraphs:
+                length = p.get("word_count", 0)
+                total += length
+                if length > longest:
+                    longest = length
+                elif length < shortest:
+                    shortest = length
+            stats["avg_paragraph_length"] = total / len(paragraphs)
+            stats["max_paragraph_length"] = longest
+            stats["min_paragraph_length"] = shortest
         
         return stats
     
@@ -367,14 +577,13 @@ class TextExtractor:
                 table_positions[table["position"]] = i
         
         # Process paragraphs and insert tables at appropriate positions
-        for i, para in enumerate(paragraphs):
-            text = para.get("text", "") if isinstance(para, dict) else para
-            style = para.get("style", {}) if isinstance(para, dict) else {}
+        for view in self._walk_paragraphs(paragraphs, annotate=False):
+            i = view.index
+            text = view.text
             
             # Check if this is a heading
-            if self._is_heading(text, style):
-                level = self._get_heading_level(text, style)
-                parts.append(f"{'#' * level} {text}")
+            if view.is_heading:
+                parts.append(f"{'#' * view.heading_level} {text}")
             else:
                 # Regular paragraph
                 parts.append(text)
@@ -408,12 +617,12 @@ class TextExtractor:
         
         # Add header row
         if rows:
-            md_lines.append("| " + " | ".join(str(cell) for cell in rows[0]) + " |")
+            md_lines.append("| " + " | ".join(map(str, rows[0])) + " |")
             md_lines.append("|" + "---|" * len(rows[0]))
             
             # Add data rows
             for row in rows[1:]:
-                md_lines.append("| " + " | ".join(str(cell) for cell in row) + " |")
+                md_lines.append("| " + " | ".join(map(str, row)) + " |")
         
         return "\n".join(md_lines)
     
@@ -424,19 +633,11 @@ class TextExtractor:
         if style.get("is_heading"):
             return True
         
-        # Check patterns
-        heading_patterns = [
-            r'^제\s*\d+\s*[장절조항]',  # 제1장, 제2절 등
-            r'^\d+\.\s+',  # 1. 2. 3.
-            r'^[가-힣]\.\s+',  # 가. 나. 다.
-            r'^Chapter\s+\d+',  # Chapter 1
-            r'^Section\s+\d+',  # Section 1
-            r'^<[ⅠⅡⅢⅣⅤⅥⅦⅧⅨⅩⅪⅫⅰⅱⅲⅳⅴⅵⅶⅷⅸⅹ]+>',  # <Ⅰ>, <Ⅱ> 등 로마 숫자
-            r'^[ⅠⅡⅢⅣⅤⅥⅦⅧⅨⅩⅪⅫⅰⅱⅲⅳⅴⅵⅶⅷⅸⅹ]+\.',  # Ⅰ. Ⅱ. 등
-            r'^[ⅠⅡⅢⅣⅤⅥⅦⅧⅨⅩⅪⅫⅰⅱⅲⅳⅴⅵⅶⅷⅸⅹ]+\s+',  # Ⅰ Ⅱ 등
-        ]
-        
-        return any(re.match(pattern, text.strip()) for pattern in heading_patterns)
+        # Check patterns - 빈 문단(간격용)은 정규식 없이 바로 제외
+        stripped = text.strip()
+        if not stripped:
+            return False
+        return _HEADING_RE.match(stripped) is not None
     
     def _get_heading_level(self, text: str, style: Dict[str, Any]) -> int:
         """Determine heading level (1-6)."""
@@ -445,56 +646,51 @@ class TextExtractor:
             return min(max(style["level"], 1), 6)
         
         # From patterns
-        if re.match(r'^제\s*\d+\s*장', text):
-            return 1
-        elif re.match(r'^제\s*\d+\s*절', text):
-            return 2
-        elif re.match(r'^<[ⅠⅡⅢⅣⅤⅥⅦⅧⅨⅩⅪⅫ]+>', text):  # 대문자 로마 숫자
-            return 1
-        elif re.match(r'^[ⅠⅡⅢⅣⅤⅥⅦⅧⅨⅩⅪⅫ]+\.', text):  # 대문자 로마 숫자 with period
-            return 1
-        elif re.match(r'^<[ⅰⅱⅲⅳⅴⅵⅶⅷⅸⅹ]+>', text):  # 소문자 로마 숫자
-            return 2
-        elif re.match(r'^\d+\.\s+', text):
-            return 2
-        elif re.match(r'^[가-힣]\.\s+', text):
-            return 3
+        match = _HEADING_LEVEL_RE.match(text)
+        if match:
+            return _HEADING_LEVEL_BY_GROUP[match.lastgroup]
         
         return 2  # Default
     
-    def _classify_paragraph(self, para: Dict[str, Any]) -> str:
+    def _classify_paragraph(self, text: str, is_heading: bool) -> str:
         """Classify paragraph type."""
-        text = para.get("text", "")
-        
-        if self._is_heading(text, para.get("style", {})):
+        if is_heading:
             return "heading"
-        elif re.match(r'^[\s]*[•·▪▫◦‣⁃\-\*]\s+', text):
+        elif _LIST_BULLET_RE.match(text):
             return "list_item"
-        elif re.match(r'^[\s]*\d+[\.\)]\s+', text):
+        elif _LIST_NUM_RE.match(text):
             return "numbered_list"
         elif len(text) < 50 and text.isupper():
             return "title"
         else:
             return "normal"
     
-    def _tag_paragraph(self, text: str) -> List[str]:
-        """Generate semantic tags for paragraph."""
+    def _tag_paragraph(self, text: str, word_count: Optional[int] = None) -> List[str]:
+        """Generate semantic tags for paragraph (word_count is computed when omitted)."""
+        # 두 글자 미만이거나 공백뿐인 문단은 어떤 내용 패턴도 일치할 수 없음
+        # (가장 짧은 통화 패턴도 "$1" 두 글자) - 단어 수 10 미만이므로 short만 붙임
+        if len(text) < 2 or text.isspace():
+            return ["short"]
+        
         tags = []
         
-        # Content type tags
-        if re.search(r'\d{4}[-/년]\s*\d{1,2}[-/월]\s*\d{1,2}', text):
+        # Content type tags - 패턴에 반드시 들어가는 리터럴을 먼저 확인해
+        # 대부분의 문단에서 정규식 탐색 자체를 건너뜀 (in 검사는 memchr 수준)
+        has_dash = "-" in text
+        if (has_dash or "/" in text or "년" in text) and _DATE_RE.search(text):
             tags.append("date")
-        if re.search(r'[\w\.-]+@[\w\.-]+', text):
+        if "@" in text and _EMAIL_RE.search(text):
             tags.append("email")
-        if re.search(r'https?://\S+', text):
+        if "://" in text and _URL_RE.search(text):
             tags.append("url")
-        if re.search(r'\d{2,3}-\d{3,4}-\d{4}', text):
+        if has_dash and _PHONE_RE.search(text):
             tags.append("phone")
-        if re.search(r'[₩$¥€£]\s*[\d,]+', text):
+        if _CURRENCY_RE.search(text):
             tags.append("currency")
         
         # Length tags
-        word_count = len(text.split())
+        if word_count is None:
+            word_count = len(text.split())
         if word_count < 10:
             tags.append("short")
         elif word_count > 100:
@@ -518,59 +714,29 @@ class TextExtractor:
         
         return f"Table with {rows} rows and {cols} columns"
     
-    def _detect_list_type(self, text: str) -> str:
-        """Detect list type from text."""
-        if re.match(r'^[\s]*\d+[\.\)]\s+', text):
-            return "ordered"
-        elif re.match(r'^[\s]*[가-힣][\.\)]\s+', text):
-            return "korean_ordered"
-        else:
+    def _detect_list_type(self, match: re.Match) -> str:
+        """Detect list type from the list prefix match."""
+        list_type = match.lastgroup
+        # 번호 목록은 기호 뒤에 공백이 있어야 함 ("1.5" 같은 경우는 unordered)
+        if list_type != "unordered" and match.end() == match.end(list_type):
             return "unordered"
+        return list_type
     
-    def _detect_list_level(self, text: str) -> int:
-        """Detect list indentation level."""
-        leading_spaces = len(text) - len(text.lstrip())
+    def _detect_list_level(self, match: re.Match) -> int:
+        """Detect list indentation level from the list prefix match."""
+        # 접두어의 선행 공백([\s]*)이 끝나는 곳이 기호 그룹의 시작 위치
+        leading_spaces = match.start(match.lastgroup)
         return (leading_spaces // 2) + 1
     
     def _classify_heading(self, text: str) -> str:
         """Classify heading type."""
-        if re.match(r'^제\s*\d+\s*[장절조항]', text):
+        if _LEGAL_HEADING_RE.match(text):
             return "legal"
-        elif re.match(r'^Chapter|Section', text, re.I):
+        elif _ACADEMIC_HEADING_RE.match(text):
             return "academic"
         else:
             return "general"
     
-    def _build_hierarchy(self, sections: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Build hierarchical structure from flat sections."""
-        if not sections:
-            return []
-        
-        # Create a tree structure
-        hierarchy = []
-        stack = []
-        
-        for section in sections:
-            node = {
-                "text": section["text"],
-                "level": section["level"],
-                "index": section["index"],
-                "children": []
-            }
-            
-            # Find parent
-            while stack and stack[-1]["level"] >= node["level"]:
-                stack.pop()
-            
-            if stack:
-                stack[-1]["children"].append(node)
-            else:
-                hierarchy.append(node)
-            
-            stack.append(node)
-        
-        return hierarchy
-    
     def _is_table_text(self, text: str) -> bool:
         """Check if text contains table data with <> delimiters."""
         # Count occurrences of <> patterns
@@ -590,20 +756,16 @@ class TextExtractor:
         # Find lines that contain table data
         for line in lines:
             if '<' in line and '>' in line:
-                # Extract cells from the line
+                # Extract cells from the line - 문자 단위 상태 기계 대신
+                # 정규식이 셀 경계를 찾음. 닫히지 않은 '<'는 다음 '<'에서
+                # 버려지고, 짝 없는 '>'는 기존처럼 직전 셀 값을 다시 넣음
                 cells = []
-                current_cell = ""
-                in_cell = False
-                
-                for char in line:
-                    if char == '<':
-                        in_cell = True
-                        current_cell = ""
-                    elif char == '>':
-                        in_cell = False
-                        cells.append(current_cell.strip())
-                    elif in_cell:
-                        current_cell += char
+                cell = ""
+                for match in _TABLE_CELL_RE.finditer(line):
+                    content = match.group(1)
+                    if content is not None:
+                        cell = content.strip()
+                    cells.append(cell)
                 
                 if cells:
                     table_lines.append(cells)
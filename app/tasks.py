@@ -2,17 +2,39 @@
 Celery tasks for background processing
 """
 import os
-import tempfile
 import structlog
-from typing import Dict, Any
+from typing import Dict, Any, Iterator
 from celery import Task
 from app.core.celery_app import celery_app
 from app.services.hwp_parser import get_parser  # v1.1: 싱글톤 사용
 from app.services.text_extractor import TextExtractor
+from app.services.stream_parser import iter_pdf_pages
 from app.core.cache import CacheManager
+from app.core.config import settings
 
 logger = structlog.get_logger()
 
+# 이보다 작은 파일은 처리가 금방 끝나므로 중간 상태(PROCESSING)를 결과 백엔드에 기록하지 않음
+SMALL_FILE_BYTES = 1024 * 1024
+
+# 대용량 파일 처리 진행률을 결과 백엔드에 기록하는 최소 간격 (%)
+LARGE_FILE_PROGRESS_STEP = 5.0
+
+
+def _iter_large_file_chunks(file_path: str, file_ext: str) -> Iterator[Dict[str, Any]]:
+    """Yield text chunks with progress (PDF one page at a time)"""
+    if file_ext == ".pdf":
+        yield from iter_pdf_pages(file_path)
+        return
+    
+    # HWP/HWPX는 스트리밍 파서가 없으므로 한 번 파싱한 결과를 하나의 청크로 넘김
+    parser = get_parser()
+    yield {
+        "type": "text_chunk",
+        "content": parser.text_from_content(parser.parse(file_path)),
+        "progress": 100.0
+    }
+
 
 class CallbackTask(Task):
     """Task with callbacks for better error handling"""
@@ -29,7 +51,7 @@ class CallbackTask(Task):
 @celery_app.task(bind=True, base=CallbackTask, name="extract_file_async")
 def extract_file_async(
     self,
-    file_content: bytes,
+    file_path: str,
     file_name: str,
     extraction_type: str,
     options: Dict[str, Any]
@@ -38,7 +60,7 @@ def extract_file_async(
     Extract content from file asynchronously
     
     Args:
-        file_content: File content as bytes
+        file_path: Uploaded file in the shared upload directory (removed after processing)
         file_name: Original file name
         extraction_type: Type of extraction (json, text, markdown)
         options: Extraction options
@@ -46,34 +68,29 @@ def extract_file_async(
     Returns:
         Extracted content
     """
-    temp_file_path = None
-    
     try:
-        # Update task state
-        self.update_state(state="PROCESSING", meta={"status": "Saving file"})
-        
         # Determine file extension
         file_ext = os.path.splitext(file_name)[1].lower()
         if file_ext not in ['.hwp', '.hwpx', '.pdf']:
             raise ValueError(f"Unsupported file type: {file_ext}")
         
-        # Save file temporarily
-        with tempfile.NamedTemporaryFile(delete=False, suffix=file_ext) as tmp:
-            tmp.write(file_content)
-            temp_file_path = tmp.name
+        # 작은 파일은 상태 기록용 Redis 왕복이 처리 시간의 대부분이라 생략
+        report_progress = os.path.getsize(file_path) >= SMALL_FILE_BYTES
         
         # Update task state
-        self.update_state(state="PROCESSING", meta={"status": "Parsing file"})
+        if report_progress:
+            self.update_state(state="PROCESSING", meta={"status": "Parsing file"})
         
         # Initialize parser and extractor (v1.1: 싱글톤 사용으로 메모리 최적화)
         parser = get_parser()
         extractor = TextExtractor()
         
-        # Parse file
-        parsed_content = parser.parse(temp_file_path)
+        # Parse file - 텍스트 추출도 이 결과를 재사용 (extract_text는 다시 파싱함)
+        parsed_content = parser.parse(file_path)
         
         # Update task state
-        self.update_state(state="PROCESSING", meta={"status": "Extracting content"})
+        if report_progress:
+            self.update_state(state="PROCESSING", meta={"status": "Extracting content"})
         
         # Extract based on type
         if extraction_type == "json":
@@ -84,7 +101,7 @@ def extract_file_async(
                 include_statistics=options.get("include_statistics", True)
             )
         elif extraction_type == "text":
-            text = parser.extract_text(temp_file_path)
+            text = parser.text_from_content(parsed_content)
             if not options.get("preserve_formatting", False):
                 text = ' '.join(text.split())
             result = {"text": text}
@@ -123,8 +140,8 @@ def extract_file_async(
         
     finally:
         # Cleanup
-        if temp_file_path and os.path.exists(temp_file_path):
-            os.unlink(temp_file_path)
+        if os.path.exists(file_path):
+            os.unlink(file_path)
 
 
 @celery_app.task(bind=True, base=CallbackTask, name="process_large_file")
@@ -138,10 +155,11 @@ def process_large_file(
     
     Args:
         file_path: Path to the file
-        processing_options: Processing options
+        processing_options: Processing options (file_type: extension override,
+            preserve_formatting: keep line breaks, default True)
         
     Returns:
-        Processing result
+        Processing result (extracted text is written to output_path)
     """
     try:
         # Update task state
@@ -153,16 +171,68 @@ def process_large_file(
             }
         )
         
-        # TODO: Implement large file processing logic
-        # This could include:
-        # - Chunked processing
-        # - Memory-efficient parsing
-        # - Progress reporting
+        file_ext = processing_options.get("file_type") or os.path.splitext(file_path)[1].lower()
+        if not file_ext.startswith("."):
+            file_ext = f".{file_ext}"
+        if file_ext not in ['.hwp', '.hwpx', '.pdf']:
+            raise ValueError(f"Unsupported file type: {file_ext}")
+        
+        preserve_formatting = processing_options.get("preserve_formatting", True)
+        separator = "\n" if preserve_formatting else " "
+        os.makedirs(settings.OUTPUT_DIR, exist_ok=True)
+        output_path = os.path.join(settings.OUTPUT_DIR, f"{self.request.id}.txt")
+        
+        # 페이지 단위로 읽은 텍스트를 바로 출력 파일에 쓰고 버려 워커 메모리와
+        # 결과 백엔드에 전체 텍스트가 남지 않게 함 - 진행률은 청크마다가 아니라
+        # LARGE_FILE_PROGRESS_STEP마다 한 번 기록
+        chunk_count = 0
+        char_count = 0
+        next_report = LARGE_FILE_PROGRESS_STEP
+        try:
+            with open(output_path, "w", encoding="utf-8") as out:
+                for chunk in _iter_large_file_chunks(file_path, file_ext):
+                    chunk_count += 1
+                    content = chunk["content"]
+                    if not preserve_formatting:
+                        content = ' '.join(content.split())
+                    if content:
+                        if char_count:
+                            out.write(separator)
+                            char_count += len(separator)
+                        out.write(content)
+                        char_count += len(content)
+                    if chunk["progress"] >= next_report:
+                        self.update_state(
+                            state="PROCESSING",
+                            meta={
+                                "status": "Processing large file",
+                                "file_path": file_path,
+                                "progress": chunk["progress"]
+                            }
+                        )
+                        next_report = chunk["progress"] + LARGE_FILE_PROGRESS_STEP
+        except BaseException:
+            # 중간에 실패하면 일부만 기록된 출력 파일을 남기지 않음
+            if os.path.exists(output_path):
+                os.unlink(output_path)
+            raise
+        
+        logger.info(
+            "Large file processed",
+            task_id=self.request.id,
+            file_path=file_path,
+            output_path=output_path,
+            chunk_count=chunk_count,
+            char_count=char_count
+        )
         
         return {
             "success": True,
             "file_path": file_path,
-            "message": "Large file processed successfully"
+            "output_path": output_path,
+            "message": "Large file processed successfully",
+            "chunk_count": chunk_count,
+            "char_count": char_count
         }
         
     except Exception as e:
@@ -190,26 +260,31 @@ def cleanup_old_files(directory: str, max_age_hours: int = 24) -> Dict[str, Any]
     import time
     
     cleaned_count = 0
+    failed = {}
     current_time = time.time()
     max_age_seconds = max_age_hours * 3600
     
     try:
-        for filename in os.listdir(directory):
-            file_path = os.path.join(directory, filename)
-            
-            # Skip if not a file
-            if not os.path.isfile(file_path):
-                continue
-            
-            # Check file age
-            file_age = current_time - os.path.getmtime(file_path)
-            if file_age > max_age_seconds:
+        # scandir은 디렉토리 항목의 파일 종류를 함께 받아 오므로 파일당 stat은 mtime 확인 한 번뿐
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                # Skip if not a file
+                if not entry.is_file(follow_symlinks=False):
+                    continue
+                
                 try:
-                    os.unlink(file_path)
-                    cleaned_count += 1
-                    logger.info("Deleted old file", file_path=file_path)
-                except Exception as e:
-                    logger.error("Failed to delete file", file_path=file_path, error=str(e))
+                    # Check file age
+                    if current_time - entry.stat(follow_symlinks=False).st_mtime > max_age_seconds:
+                        os.unlink(entry.path)
+                        cleaned_count += 1
+                except OSError as e:
+                    failed[entry.name] = str(e)
+        
+        # 파일마다 로그를 남기지 않고 결과를 한 번에 기록
+        if cleaned_count:
+            logger.info("Deleted old files", directory=directory, cleaned_count=cleaned_count)
+        if failed:
+            logger.error("Failed to delete files", directory=directory, failed=failed)
         
         return {
             "success": True,
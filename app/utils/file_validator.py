@@ -2,8 +2,11 @@
 Enhanced file validation utilities
 """
 import os
+import copy
+import time
 import hashlib
 import structlog
+from collections import OrderedDict
 from typing import Optional, Tuple, Dict, Any
 from pathlib import Path
 import zipfile
@@ -54,6 +57,19 @@ DANGEROUS_PATTERNS = [
     b'/bin/bash'
 ]
 
+# 위협 패턴 검사 읽기 단위와 청크 경계에 걸친 패턴을 찾기 위해 겹쳐 볼 길이
+THREAT_SCAN_CHUNK_SIZE = 1024 * 1024
+_PATTERN_OVERLAP = max(len(pattern) for pattern in DANGEROUS_PATTERNS) - 1
+
+# libmagic이 파일 앞부분만으로 판별하는 형식과 읽을 길이
+# (HWP는 OLE 복합 문서라 libmagic이 파일 곳곳의 디렉토리 섹터를 따라가야 하므로 제외)
+MAGIC_HEAD_EXTENSIONS = {'.pdf', '.hwpx'}
+MAGIC_HEAD_SIZE = 4096
+
+# 검증 결과 캐시 크기와 유효 시간 (같은 파일의 재시도/중복 제출 재검증용)
+VALIDATION_CACHE_SIZE = 4096
+VALIDATION_CACHE_TTL_SECONDS = 300
+
 
 class FileValidator:
     """Enhanced file validation with security checks"""
@@ -67,14 +83,42 @@ class FileValidator:
         else:
             self.mime = None
             self.file_magic = None
+        # (stat fingerprint, extension, virus scan flag) -> (cached at, validation result)
+        self._result_cache: OrderedDict = OrderedDict()
+    
+    @staticmethod
+    def _magic_type(magic_obj, file_path: str, head: Optional[bytes]) -> Optional[str]:
+        """Detect type with libmagic from the file head when available, else the file"""
+        if magic_obj is None:
+            return None
+        if head is not None:
+            return magic_obj.from_buffer(head)
+        return magic_obj.from_file(file_path)
+    
+    def _get_cached_result(self, key: tuple, filename: str) -> Optional[Dict[str, Any]]:
+        """Return a copy of a cached validation result that has not expired"""
+        entry = self._result_cache.get(key)
+        if entry is None:
+            return None
+        cached_at, result = entry
+        if time.monotonic() - cached_at > VALIDATION_CACHE_TTL_SECONDS:
+            del self._result_cache[key]
+            return None
+        self._result_cache.move_to_end(key)
+        result = copy.deepcopy(result)
+        result["metadata"]["filename"] = filename
+        return result
+    
+    def _remember_result(self, key: tuple, result: Dict[str, Any]) -> None:
+        """Cache a validation result, evicting the least recently used entry"""
+        self._result_cache[key] = (time.monotonic(), copy.deepcopy(result))
+        self._result_cache.move_to_end(key)
+        if len(self._result_cache) > VALIDATION_CACHE_SIZE:
+            self._result_cache.popitem(last=False)
     
     def calculate_file_hash(self, file_path: str) -> str:
         """Calculate SHA256 hash of file"""
-        sha256_hash = hashlib.sha256()
-        with open(file_path, "rb") as f:
-            for byte_block in iter(lambda: f.read(4096), b""):
-                sha256_hash.update(byte_block)
-        return sha256_hash.hexdigest()
+        return virus_scanner.calculate_file_hash(file_path)
     
     def validate_extension(self, filename: str) -> Tuple[bool, Optional[str]]:
         """Validate file extension"""
@@ -87,15 +131,21 @@ class FileValidator:
         
         return True, None
     
-    def validate_mime_type(self, file_path: str, expected_ext: str) -> Tuple[bool, Optional[str]]:
-        """Validate MIME type matches expected extension"""
+    def validate_mime_type(
+        self,
+        file_path: str,
+        expected_ext: str,
+        mime_type: Optional[str] = None
+    ) -> Tuple[bool, Optional[str]]:
+        """Validate MIME type matches expected extension (detected when not given)"""
         if not MAGIC_AVAILABLE or not self.mime:
             # Fallback to extension-based validation
             logger.warning("MIME type validation skipped (python-magic not available)")
             return True, None
             
         try:
-            mime_type = self.mime.from_file(file_path)
+            if mime_type is None:
+                mime_type = self.mime.from_file(file_path)
             allowed_mimes = ALLOWED_EXTENSIONS.get(expected_ext, [])
             
             if mime_type not in allowed_mimes:
@@ -138,24 +188,51 @@ class FileValidator:
     
     def scan_for_threats(self, file_path: str) -> Tuple[bool, Optional[str]]:
         """Scan file for dangerous patterns"""
+        valid, error, _ = self.scan_and_hash(file_path)
+        return valid, error
+    
+    def scan_and_hash(self, file_path: str) -> Tuple[bool, Optional[str], Optional[str]]:
+        """
+        Scan file for dangerous patterns and SHA256-hash it in the same read pass.
+        
+        Returns:
+            (valid, error, hex digest or None when the file could not be read)
+        """
         try:
+            sha256_hash = hashlib.sha256()
+            detected = None
+            tail = b""
             with open(file_path, 'rb') as f:
+                st = os.fstat(f.fileno())
                 # Read file in chunks to avoid memory issues
                 while True:
-                    chunk = f.read(1024 * 1024)  # 1MB chunks
+                    chunk = f.read(THREAT_SCAN_CHUNK_SIZE)
                     if not chunk:
                         break
                     
-                    for pattern in DANGEROUS_PATTERNS:
-                        if pattern in chunk:
-                            logger.warning("Dangerous pattern detected", 
-                                         pattern=pattern.decode('utf-8', errors='ignore'))
-                            return False, f"Potentially dangerous content detected"
+                    sha256_hash.update(chunk)
+                    if detected is None:
+                        # 직전 청크 끝과 이번 청크 앞을 이어 경계에 걸친 패턴도 검사
+                        boundary = tail + chunk[:_PATTERN_OVERLAP]
+                        for pattern in DANGEROUS_PATTERNS:
+                            if pattern in chunk or pattern in boundary:
+                                detected = pattern
+                                break
+                        tail = chunk[-_PATTERN_OVERLAP:]
             
-            return True, None
+            # 이후 바이러스 검사와 메타데이터 해시가 파일을 다시 읽지 않도록 캐시에 등록
+            file_hash = sha256_hash.hexdigest()
+            virus_scanner.remember_file_hash(st, file_hash)
+            
+            if detected is not None:
+                logger.warning("Dangerous pattern detected", 
+                             pattern=detected.decode('utf-8', errors='ignore'))
+                return False, f"Potentially dangerous content detected", file_hash
+            
+            return True, None, file_hash
         except Exception as e:
             logger.error("Failed to scan file", error=str(e))
-            return False, f"Failed to scan file: {str(e)}"
+            return False, f"Failed to scan file: {str(e)}", None
     
     def validate_file_structure(self, file_path: str, file_ext: str) -> Tuple[bool, Optional[str]]:
         """Validate internal file structure"""
@@ -208,14 +285,37 @@ class FileValidator:
         
         file_ext = Path(filename).suffix.lower()
         
+        # 같은 파일(Celery 재시도, 중복 제출)이면 해시/위협/바이러스 검사를 다시 하지 않음
+        # 내용이 바뀌면 mtime이나 크기가 바뀌므로 stat 지문을 키로 사용
+        try:
+            st = os.stat(file_path)
+            cache_key = (st.st_dev, st.st_ino, st.st_mtime_ns, st.st_size, file_ext, enable_virus_scan)
+        except OSError:
+            cache_key = None
+        if cache_key is not None:
+            cached = self._get_cached_result(cache_key, filename)
+            if cached is not None:
+                logger.debug("File validation cache hit", filename=filename)
+                return cached
+        
         # Check file size
         valid, error = self.validate_file_size(file_path, file_ext)
         if not valid:
             result["errors"].append(error)
             return result
         
-        # Check MIME type
-        valid, error = self.validate_mime_type(file_path, file_ext)
+        # Check MIME type - 감지한 MIME은 메타데이터에 재사용
+        # (감지 실패 시 validate_mime_type이 다시 시도해 오류를 보고)
+        # 앞부분으로 판별 가능한 형식은 첫 페이지만 한 번 읽어 MIME과 파일 종류 판별에 함께 사용
+        head = None
+        try:
+            if file_ext in MAGIC_HEAD_EXTENSIONS and self.mime:
+                with open(file_path, 'rb') as f:
+                    head = f.read(MAGIC_HEAD_SIZE)
+            mime_type = self._magic_type(self.mime, file_path, head)
+        except Exception:
+            mime_type = None
+        valid, error = self.validate_mime_type(file_path, file_ext, mime_type)
         if not valid:
             result["errors"].append(error)
             return result
@@ -226,8 +326,8 @@ class FileValidator:
             result["errors"].append(error)
             return result
         
-        # Scan for threats
-        valid, error = self.scan_for_threats(file_path)
+        # Scan for threats - 같은 읽기에서 해시도 계산
+        valid, error, file_hash = self.scan_and_hash(file_path)
         if not valid:
             result["warnings"].append(error)
             # Don't return here, just add warning
@@ -247,12 +347,13 @@ class FileValidator:
                 logger.error("Virus scan failed", error=str(e))
                 result["warnings"].append(f"Virus scan failed: {str(e)}")
         
-        # Calculate file hash
-        file_hash = self.calculate_file_hash(file_path)
+        # Calculate file hash (스캔 중 읽기에 실패한 경우에만)
+        if file_hash is None:
+            file_hash = self.calculate_file_hash(file_path)
         
         # Get file info
         file_size = os.path.getsize(file_path)
-        file_type = self.file_magic.from_file(file_path) if self.file_magic else "Unknown"
+        file_type = self._magic_type(self.file_magic, file_path, head) or "Unknown"
         
         result["valid"] = len(result["errors"]) == 0
         result["metadata"] = {
@@ -261,7 +362,7 @@ class FileValidator:
             "size": file_size,
             "hash": file_hash,
             "type": file_type,
-            "mime": self.mime.from_file(file_path) if self.mime else "Unknown"
+            "mime": mime_type or "Unknown"
         }
         
         logger.info("File validation completed", 
@@ -271,6 +372,10 @@ class FileValidator:
                    warnings=result["warnings"],
                    virus_scan_status=result["virus_scan"]["status"] if result["virus_scan"] else "skipped")
         
+        # 오류가 있는 결과는 캐시하지 않아 수정된 파일의 재시도는 다시 검증
+        if cache_key is not None and result["valid"]:
+            self._remember_result(cache_key, result)
+        
         return result
     
     def validate_file(self, file_path: str, filename: str) -> Dict[str, Any]:
@@ -7,9 +7,12 @@ v2.0: RSS 기반 메모리 모니터링으로 변경
 - 주기적 GC 대신 임계값 초과 시에만 GC 실행
 """
 import gc
+import os
+import ctypes
+import sys
 import psutil
 import structlog
-from typing import Optional
+from typing import Optional, Tuple
 from contextlib import contextmanager
 import asyncio
 
@@ -19,6 +22,15 @@ logger = structlog.get_logger()
 RSS_WARNING_MB = 300  # 300MB 초과 시 경고
 RSS_CRITICAL_MB = 400  # 400MB 초과 시 GC 강제 실행
 
+BYTES_PER_MB = 1024 * 1024
+PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+# glibc malloc_trim - 해제된 힙 아레나를 OS에 돌려줌 (glibc가 아니면 None)
+try:
+    _malloc_trim = ctypes.CDLL("libc.so.6").malloc_trim
+except (OSError, AttributeError):
+    _malloc_trim = None
+
 
 class MemoryManager:
     """
@@ -34,36 +46,80 @@ class MemoryManager:
                  rss_critical_mb: float = RSS_CRITICAL_MB):
         self.rss_warning_mb = rss_warning_mb
         self.rss_critical_mb = rss_critical_mb
+        # 점검 경로에서는 RSS 바이트 정수를 그대로 비교 (MB 변환은 로그/리포트 때만)
+        self._rss_warning_bytes = int(rss_warning_mb * BYTES_PER_MB)
+        self._rss_critical_bytes = int(rss_critical_mb * BYTES_PER_MB)
         self.process = psutil.Process()
         self._last_gc_time = 0
         self._gc_cooldown_seconds = 30  # GC 최소 간격
+        # Linux에서 RSS를 바로 읽을 /proc/<pid>/statm fd (열린 프로세스의 pid와 함께 보관)
+        self._statm_fd: Optional[int] = None
+        self._statm_pid: Optional[int] = None
 
     def get_memory_usage(self) -> dict:
         """Get current memory usage statistics (v2.0: RSS 중심)"""
-        memory_info = self.process.memory_info()
-        rss_mb = memory_info.rss / 1024 / 1024
-
-        # RSS 기반 상태 결정
-        if rss_mb > self.rss_critical_mb:
-            status = "critical"
-        elif rss_mb > self.rss_warning_mb:
-            status = "warning"
+        pages = self._read_statm()
+        if pages is not None:
+            vms, rss = pages[0] * PAGE_SIZE, pages[1] * PAGE_SIZE
         else:
-            status = "ok"
+            memory_info = self.process.memory_info()
+            vms, rss = memory_info.vms, memory_info.rss
 
+        # MB는 정수(MiB)로 내림해 보고
         return {
-            "process_rss_mb": rss_mb,
-            "process_vms_mb": memory_info.vms / 1024 / 1024,
-            "status": status,
+            "process_rss_mb": rss >> 20,
+            "process_vms_mb": vms >> 20,
+            "status": self._status(rss),
             "threshold_warning_mb": self.rss_warning_mb,
             "threshold_critical_mb": self.rss_critical_mb,
         }
 
+    def _rss_bytes(self) -> int:
+        """Current process RSS in bytes (내부 점검용 - 통계 dict를 만들지 않음)"""
+        pages = self._read_statm()
+        if pages is not None:
+            return pages[1] * PAGE_SIZE
+        return self.process.memory_info().rss
+
+    def _read_statm(self) -> Optional[Tuple[int, int]]:
+        """(size, resident) pages from /proc/<pid>/statm, or None off Linux"""
+        fd = self._statm_fd_for_current_process()
+        if fd is None:
+            return None
+        # psutil 래퍼 없이 한 번의 pread로 앞의 두 필드(VMS, RSS 페이지 수)만 읽음
+        try:
+            fields = os.pread(fd, 64, 0).split(None, 2)
+            return int(fields[0]), int(fields[1])
+        except (OSError, ValueError, IndexError):
+            self._statm_fd = None
+            return None
+
+    def _statm_fd_for_current_process(self) -> Optional[int]:
+        """Open /proc/<pid>/statm once per process (Linux only)"""
+        pid = os.getpid()
+        if self._statm_pid != pid:
+            # fork된 워커는 부모의 statm을 가리키는 fd를 물려받으므로 pid가 바뀌면 다시 엶
+            self._statm_pid = pid
+            self._statm_fd = None
+            if sys.platform.startswith("linux"):
+                try:
+                    self._statm_fd = os.open(f"/proc/{pid}/statm", os.O_RDONLY)
+                except OSError:
+                    pass
+        return self._statm_fd
+
+    def _status(self, rss_bytes: int) -> str:
+        """RSS 기반 상태 결정"""
+        if rss_bytes > self._rss_critical_bytes:
+            return "critical"
+        elif rss_bytes > self._rss_warning_bytes:
+            return "warning"
+        return "ok"
+
     def check_memory_available(self, required_mb: float) -> bool:
         """Check if enough memory is available based on RSS"""
-        stats = self.get_memory_usage()
         # RSS + 요청량이 critical 임계값을 넘지 않으면 허용
-        return (stats["process_rss_mb"] + required_mb) < self.rss_critical_mb
+        return self._rss_bytes() + required_mb * BYTES_PER_MB < self._rss_critical_bytes
 
     def force_cleanup(self) -> float:
         """Force garbage collection with cooldown"""
@@ -74,32 +130,45 @@ class MemoryManager:
         if current_time - self._last_gc_time < self._gc_cooldown_seconds:
             return 0.0
 
-        before = self.get_memory_usage()
-        gc.collect()
-        after = self.get_memory_usage()
+        before = self._rss_bytes()
+        # 전체 힙 추적(수십 ms) 대신 젊은 세대만 수집하고 해제된 아레나를 OS에 반환
+        gc.collect(0)
+        self._trim_heap()
+        after = self._rss_bytes()
+        if after >= self._rss_critical_bytes:
+            # 그래도 임계값 이상이면 오래된 순환 참조까지 전체 수집
+            gc.collect()
+            self._trim_heap()
+            after = self._rss_bytes()
 
         self._last_gc_time = current_time
-        freed_mb = before["process_rss_mb"] - after["process_rss_mb"]
+        freed_mb = (before - after) / BYTES_PER_MB
 
         if freed_mb > 0:
             logger.info(f"Memory cleanup freed {freed_mb:.2f} MB",
-                       before_mb=before["process_rss_mb"],
-                       after_mb=after["process_rss_mb"])
+                       before_mb=before >> 20,
+                       after_mb=after >> 20)
 
         return freed_mb
 
+    @staticmethod
+    def _trim_heap() -> None:
+        """Return freed malloc arenas to the OS (glibc only)"""
+        if _malloc_trim is not None:
+            _malloc_trim(0)
+
     @contextmanager
     def memory_limit_context(self, max_mb: float):
         """Context manager to limit memory usage"""
-        initial_usage = self.get_memory_usage()
+        initial = self._rss_bytes()
 
         try:
             yield
         finally:
-            current_usage = self.get_memory_usage()
-            used_mb = current_usage["process_rss_mb"] - initial_usage["process_rss_mb"]
+            used = self._rss_bytes() - initial
 
-            if used_mb > max_mb:
+            if used > max_mb * BYTES_PER_MB:
+                used_mb = used / BYTES_PER_MB
                 logger.warning(
                     f"Memory limit exceeded: used {used_mb:.2f} MB, limit {max_mb:.2f} MB"
                 )
@@ -117,21 +186,21 @@ class MemoryManager:
 
         while True:
             try:
-                stats = self.get_memory_usage()
-                rss_mb = stats["process_rss_mb"]
+                rss = self._rss_bytes()
+                status = self._status(rss)
 
-                if stats["status"] == "critical":
+                if status == "critical":
                     logger.error(
                         "CRITICAL: Memory usage exceeds threshold",
-                        rss_mb=rss_mb,
+                        rss_mb=rss >> 20,
                         threshold_mb=self.rss_critical_mb
                     )
                     self.force_cleanup()
 
-                elif stats["status"] == "warning":
+                elif status == "warning":
                     logger.warning(
                         "WARNING: Memory usage elevated",
-                        rss_mb=rss_mb,
+                        rss_mb=rss >> 20,
                         threshold_mb=self.rss_warning_mb
                     )
                     # Warning 상태에서는 GC 시도하지 않음 (불필요한 CPU 사용 방지)
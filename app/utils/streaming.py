@@ -2,18 +2,71 @@
 Streaming utilities for efficient file processing.
 """
 import io
+import os
 import asyncio
 from typing import AsyncIterator, BinaryIO, Optional
 import aiofiles
 import structlog
+from app.utils.file_utils import copy_fd_range, regular_file_fd
 
 logger = structlog.get_logger()
 
+# 호출자가 chunk_size를 지정하지 않았을 때의 기본값 (읽기 시 블록 크기에 맞춰 키움)
+DEFAULT_CHUNK_SIZE = 8192
+# 파일시스템 블록 크기로 정하는 읽기 단위 범위
+MIN_READ_CHUNK_SIZE = 64 * 1024
+MAX_READ_CHUNK_SIZE = 256 * 1024
+
+# 업로드 저장 시 한 번에 읽고 쓰는 최소 크기 (쓰기 syscall 수를 줄임)
+UPLOAD_COPY_CHUNK_SIZE = 1024 * 1024
+
+
+def _copy_stream(src: BinaryIO, dst_path: str, chunk_size: int, max_size: Optional[int]) -> int:
+    """Copy src to dst_path with a size limit; returns bytes written."""
+    total_size = 0
+    # 버퍼 없는 FileIO로 써서 BufferedWriter 사본을 거치지 않음
+    with open(dst_path, 'wb', buffering=0) as dst:
+        while True:
+            chunk = src.read(chunk_size)
+            if not chunk:
+                break
+            
+            total_size += len(chunk)
+            if max_size and total_size > max_size:
+                raise ValueError(f"File exceeds maximum size of {max_size} bytes")
+            
+            dst.write(chunk)
+    return total_size
+
+
+def _copy_file_stream(src: BinaryIO, src_fd: int, dst_path: str, max_size: Optional[int]) -> int:
+    """Copy a disk-backed src from its position to dst_path in-kernel; returns bytes copied."""
+    start = src.tell()
+    size = os.fstat(src_fd).st_size - start
+    # 크기를 미리 알 수 있으므로 복사 전에 한도를 확인
+    if max_size and size > max_size:
+        raise ValueError(f"File exceeds maximum size of {max_size} bytes")
+    
+    with open(dst_path, 'wb', buffering=0) as dst:
+        copied = copy_fd_range(src_fd, dst.fileno(), start, size)
+    # 일반 read()로 끝까지 읽은 것과 같은 위치로 맞춤
+    src.seek(start + copied)
+    return copied
+
+
+def _detect_block_size(path: str) -> int:
+    """Read unit for path: 16 filesystem blocks within 64-256 KiB."""
+    try:
+        block_size = os.statvfs(path).f_bsize
+    except (AttributeError, OSError):
+        return MIN_READ_CHUNK_SIZE
+    return max(MIN_READ_CHUNK_SIZE, min(MAX_READ_CHUNK_SIZE, block_size * 16))
+
 
 class StreamingFileProcessor:
     """Process files in streaming fashion to minimize memory usage."""
     
-    def __init__(self, chunk_size: int = 8192):
+    def __init__(self, chunk_size: int = DEFAULT_CHUNK_SIZE):
         """
         Initialize streaming processor.
         
@@ -32,10 +85,15 @@ class StreamingFileProcessor:
         Yields:
             Chunks of file content
         """
+        # 기본 청크 크기면 8 KiB마다 스레드풀을 오가지 않도록 블록 크기에 맞춰 키움
+        chunk_size = self.chunk_size
+        if chunk_size == DEFAULT_CHUNK_SIZE:
+            chunk_size = _detect_block_size(file_path)
+        
         try:
             async with aiofiles.open(file_path, 'rb') as file:
                 while True:
-                    chunk = await file.read(self.chunk_size)
+                    chunk = await file.read(chunk_size)
                     if not chunk:
                         break
                     yield chunk
@@ -63,28 +121,29 @@ class StreamingFileProcessor:
         Raises:
             ValueError: If file exceeds max_size
         """
-        total_size = 0
-        
         try:
-            async with aiofiles.open(output_path, 'wb') as output_file:
-                while True:
-                    chunk = file_stream.read(self.chunk_size)
-                    if not chunk:
-                        break
-                    
-                    total_size += len(chunk)
-                    
-                    if max_size and total_size > max_size:
-                        # Clean up partial file
-                        await output_file.close()
-                        import os
-                        os.unlink(output_path)
-                        raise ValueError(f"File exceeds maximum size of {max_size} bytes")
-                    
-                    await output_file.write(chunk)
-                    
-                    # Yield control to prevent blocking
-                    await asyncio.sleep(0)
+            # 청크마다 aiofiles 스레드풀을 오가는 대신 복사 전체를 한 번의 스레드 호출로
+            # 수행 (file_stream.read도 동기 호출이라 이벤트 루프를 막지 않게 됨)
+            # 디스크 파일이 입력이면 커널 내 복사로 유저 공간을 거치지 않음
+            src_fd = regular_file_fd(file_stream)
+            try:
+                if src_fd is not None:
+                    total_size = await asyncio.to_thread(
+                        _copy_file_stream, file_stream, src_fd, output_path, max_size
+                    )
+                else:
+                    total_size = await asyncio.to_thread(
+                        _copy_stream,
+                        file_stream,
+                        output_path,
+                        max(self.chunk_size, UPLOAD_COPY_CHUNK_SIZE),
+                        max_size
+                    )
+            except ValueError:
+                # Clean up partial file
+                if os.path.exists(output_path):
+                    os.unlink(output_path)
+                raise
             
             logger.info("File processed", path=output_path, size=total_size)
             return total_size
@@ -139,22 +198,28 @@ class ChunkedTextExtractor:
         Yields:
             Text chunks
         """
-        # Process text in chunks
-        for i in range(0, len(text), self.chunk_size):
-            chunk = text[i:i + self.chunk_size]
+        # 남은 부분을 이어 붙여 text를 다시 만들지 않고 시작 위치만 옮기며, 구분점은
+        # 현재 창 [start, start + chunk_size) 안에서만 찾음
+        start = 0
+        text_len = len(text)
+        while start < text_len:
+            end = start + self.chunk_size
+            if end >= text_len:
+                yield text[start:]
+                break
             
             # Find last complete sentence or paragraph
-            last_break = chunk.rfind('\n')
+            last_break = text.rfind('\n', start, end)
             if last_break == -1:
-                last_break = chunk.rfind('. ')
+                last_break = text.rfind('. ', start, end)
             
-            if last_break != -1 and i + self.chunk_size < len(text):
+            if last_break != -1:
                 # Yield up to the break point
-                yield chunk[:last_break + 1]
-                # Add remainder to next chunk
-                text = chunk[last_break + 1:] + text[i + self.chunk_size:]
+                yield text[start:last_break + 1]
+                start = last_break + 1
             else:
-                yield chunk
+                yield text[start:end]
+                start = end
             
             # Yield control
             await asyncio.sleep(0)
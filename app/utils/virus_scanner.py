@@ -3,10 +3,16 @@ Virus scanning module (simulation for development)
 In production, integrate with real antivirus API like ClamAV, VirusTotal, etc.
 """
 import hashlib
+import mmap
+import os
+import threading
 import structlog
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
 import asyncio
 import time
+from collections import OrderedDict
+from app.core.config import settings
+from app.utils.file_utils import MMAP_HASH_THRESHOLD
 
 logger = structlog.get_logger()
 
@@ -16,6 +22,12 @@ KNOWN_MALICIOUS_HASHES = {
     "5d41402abc4b2a76b9719d911017c592",  # Test malware hash
 }
 
+# 파일 해시 캐시 최대 항목 수 (LRU)
+HASH_CACHE_SIZE = 1024
+
+# 의심 패턴을 검사할 파일 앞부분 길이
+PATTERN_SCAN_SIZE = 1024 * 1024
+
 # Suspicious patterns (for simulation)
 SUSPICIOUS_PATTERNS = [
     b'EICAR',  # EICAR test virus pattern
@@ -34,14 +46,95 @@ class VirusScanner:
     def __init__(self):
         self.scan_count = 0
         self.last_scan_time = None
+        # (st_dev, st_ino, st_mtime_ns, st_size) -> SHA256 hex digest
+        self._hash_cache: OrderedDict = OrderedDict()
+        # 여러 파일을 워커 스레드에서 동시에 해시하므로 캐시 갱신은 잠금으로 보호
+        self._hash_cache_lock = threading.Lock()
     
     def calculate_file_hash(self, file_path: str) -> str:
-        """Calculate SHA256 hash of file"""
-        sha256_hash = hashlib.sha256()
+        """Calculate SHA256 hash of file (cached by stat fingerprint)"""
+        with open(file_path, "rb") as f:
+            st = os.fstat(f.fileno())
+            # 내용이 바뀌면 mtime이나 크기가 바뀌므로 같은 파일의 재검증(검사 후
+            # 검증 단계, Celery 재시도)은 다시 해시하지 않음
+            cached = self._cached_hash(st)
+            if cached is not None:
+                return cached
+            
+            if st.st_size < MMAP_HASH_THRESHOLD:
+                digest = hashlib.file_digest(f, "sha256").hexdigest()
+            else:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    digest = hashlib.sha256(mm).hexdigest()
+        
+        self.remember_file_hash(st, digest)
+        return digest
+    
+    def _cached_hash(self, st: os.stat_result) -> Optional[str]:
+        """Look up a cached digest for the file with this stat"""
+        key = self._hash_key(st)
+        with self._hash_cache_lock:
+            cached = self._hash_cache.get(key)
+            if cached is not None:
+                self._hash_cache.move_to_end(key)
+            return cached
+    
+    def _hash_and_scan(self, file_path: str) -> Tuple[str, list]:
+        """SHA256-hash the file and scan its head for patterns"""
         with open(file_path, "rb") as f:
-            for byte_block in iter(lambda: f.read(4096), b""):
-                sha256_hash.update(byte_block)
-        return sha256_hash.hexdigest()
+            st = os.fstat(f.fileno())
+            if st.st_size < MMAP_HASH_THRESHOLD:
+                # 작은 파일(빈 파일 포함)은 매핑 비용이 더 크므로 앞부분만 읽어 검사하고
+                # 해시는 calculate_file_hash와 같이 file_digest로 계산
+                head = f.read(PATTERN_SCAN_SIZE)
+                patterns = self._match_patterns(head, len(head))
+                digest = self._cached_hash(st)
+                if digest is None:
+                    f.seek(0)
+                    digest = hashlib.file_digest(f, "sha256").hexdigest()
+                    self.remember_file_hash(st, digest)
+                return digest, patterns
+            
+            # 해시와 패턴 검사가 같은 매핑을 공유해 파일을 두 번 읽거나 복사하지 않음
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                digest = self._cached_hash(st)
+                if digest is None:
+                    digest = hashlib.sha256(mm).hexdigest()
+                    self.remember_file_hash(st, digest)
+                patterns = self._match_patterns(mm, min(st.st_size, PATTERN_SCAN_SIZE))
+        
+        return digest, patterns
+    
+    @staticmethod
+    def _match_patterns(buf, end: int) -> list:
+        """Suspicious patterns found in buf[:end]"""
+        return [
+            pattern.decode('utf-8', errors='ignore')
+            for pattern in SUSPICIOUS_PATTERNS
+            if buf.find(pattern, 0, end) != -1
+        ]
+    
+    def remember_file_hash(self, st: os.stat_result, digest: str) -> None:
+        """Cache a SHA256 digest computed elsewhere for the file with this stat"""
+        key = self._hash_key(st)
+        with self._hash_cache_lock:
+            self._hash_cache[key] = digest
+            self._hash_cache.move_to_end(key)
+            if len(self._hash_cache) > HASH_CACHE_SIZE:
+                self._hash_cache.popitem(last=False)
+    
+    async def calculate_file_hashes_async(self, file_paths: List[str]) -> List[str]:
+        """Hash several files concurrently, in the given order"""
+        # hashlib(OpenSSL)은 해시 계산 중 GIL을 놓으므로 파일마다 워커 스레드에서
+        # 해시하면 여러 코어에서 동시에 진행됨
+        return list(await asyncio.gather(
+            *(asyncio.to_thread(self.calculate_file_hash, path) for path in file_paths)
+        ))
+    
+    @staticmethod
+    def _hash_key(st: os.stat_result) -> tuple:
+        """Build hash cache key from file stat"""
+        return (st.st_dev, st.st_ino, st.st_mtime_ns, st.st_size)
     
     def check_known_malware(self, file_hash: str) -> bool:
         """Check if file hash is in known malware database"""
@@ -52,10 +145,8 @@ class VirusScanner:
         found_patterns = []
         try:
             with open(file_path, 'rb') as f:
-                content = f.read(1024 * 1024)  # Read first 1MB
-                for pattern in SUSPICIOUS_PATTERNS:
-                    if pattern in content:
-                        found_patterns.append(pattern.decode('utf-8', errors='ignore'))
+                content = f.read(PATTERN_SCAN_SIZE)  # Read first 1MB
+                found_patterns = self._match_patterns(content, len(content))
         except Exception as e:
             logger.error("Pattern scan failed", error=str(e))
         
@@ -80,11 +171,12 @@ class VirusScanner:
         }
         
         try:
-            # Simulate scan delay (0.1-0.5 seconds)
-            await asyncio.sleep(0.1 + (self.scan_count % 5) * 0.1)
+            # Simulate scan delay (0.1-0.5 seconds) - 설정으로 켠 경우에만
+            if settings.VIRUS_SCAN_SIMULATE_DELAY:
+                await asyncio.sleep(0.1 + (self.scan_count % 5) * 0.1)
             
-            # Calculate file hash
-            file_hash = self.calculate_file_hash(file_path)
+            # Calculate file hash + pattern scan - 한 번의 매핑으로 워커 스레드에서 수행
+            file_hash, patterns = await asyncio.to_thread(self._hash_and_scan, file_path)
             result["file_hash"] = file_hash
             
             # Check known malware
@@ -97,7 +189,6 @@ class VirusScanner:
                 })
             
             # Pattern scan
-            patterns = self.scan_for_patterns(file_path)
             if patterns:
                 result["status"] = "suspicious"
                 for pattern in patterns:
@@ -122,6 +213,10 @@ class VirusScanner:
         
         return result
     
+    async def scan_batch_async(self, file_paths: List[str]) -> List[Dict[str, Any]]:
+        """Scan several files concurrently, results in the given order"""
+        return list(await asyncio.gather(*(self.scan_file_async(path) for path in file_paths)))
+    
     def scan_file(self, file_path: str) -> Dict[str, Any]:
         """
         Synchronous virus scan - simplified for development
@@ -8,9 +8,10 @@ import asyncio
 import redis
 from datetime import datetime, date
 from pathlib import Path
-from sqlalchemy import create_engine, text
+from sqlalchemy import create_engine, delete, text
 from sqlalchemy.orm import sessionmaker
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 # 프로젝트 루트를 Python 경로에 추가
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
@@ -19,6 +20,46 @@ from app.core.config import settings
 from app.models.database import ExtractionJob, CacheEntry, SystemMetric, AuditLog
 from app.db.session import get_db
 
+# Redis 키를 SCAN으로 한 번에 가져오고 UNLINK로 지울 묶음 크기
+REDIS_SCAN_BATCH = 1000
+
+# 파일 삭제를 병렬로 처리할 스레드 수와 한 번에 제출할 묶음 크기
+UNLINK_WORKERS = 8
+UNLINK_BATCH_SIZE = 1024
+
+
+def _walk_files(directory):
+    """하위 디렉토리까지 파일 항목(os.DirEntry)을 순회"""
+    # DirEntry는 디렉토리 읽기에서 얻은 파일 종류를 쓰므로 항목마다 stat하지 않음
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _walk_files(entry.path)
+            elif entry.is_file():
+                yield entry
+
+
+def _unlink_in_batches(paths):
+    """경로들을 스레드 풀에서 묶음 단위로 삭제하고 삭제한 수를 반환"""
+    deleted = 0
+    batch = []
+    with ThreadPoolExecutor(max_workers=UNLINK_WORKERS) as executor:
+        for path in paths:
+            batch.append(path)
+            if len(batch) >= UNLINK_BATCH_SIZE:
+                deleted += _unlink_batch(executor, batch)
+                batch = []
+        if batch:
+            deleted += _unlink_batch(executor, batch)
+    return deleted
+
+
+def _unlink_batch(executor, batch):
+    for path, _ in zip(batch, executor.map(os.unlink, batch), strict=True):
+        print(f"  삭제됨: {path}")
+    return len(batch)
+
+
 class DataCleaner:
     def __init__(self):
         self.redis_client = None
@@ -64,21 +105,18 @@ class DataCleaner:
             if dir_path.exists():
                 try:
                     if target_date:
-                        # 특정 날짜의 파일만 삭제
-                        for file_path in dir_path.rglob("*"):
-                            if file_path.is_file():
-                                file_date = date.fromtimestamp(file_path.stat().st_mtime)
-                                if file_date == target_date:
-                                    file_path.unlink()
-                                    cleaned_files += 1
-                                    print(f"  삭제됨: {file_path}")
+                        # 특정 날짜의 파일만 삭제 (mtime이 필요한 이 경우에만 stat)
+                        targets = (
+                            entry.path for entry in _walk_files(dir_path)
+                            if date.fromtimestamp(entry.stat().st_mtime) == target_date
+                        )
                     else:
                         # 모든 파일 삭제 (디렉토리는 유지)
-                        for file_path in dir_path.rglob("*"):
-                            if file_path.is_file() and file_path.name != ".gitkeep":
-                                file_path.unlink()
-                                cleaned_files += 1
-                                print(f"  삭제됨: {file_path}")
+                        targets = (
+                            entry.path for entry in _walk_files(dir_path)
+                            if entry.name != ".gitkeep"
+                        )
+                    cleaned_files += _unlink_in_batches(targets)
                     
                     cleaned_dirs.append(str(directory))
                 except Exception as e:
@@ -100,10 +138,22 @@ class DataCleaner:
                 # 특정 날짜의 캐시만 삭제 (구현이 복잡하므로 전체 삭제 권장)
                 print("  특정 날짜 캐시 삭제는 복잡하므로 전체 캐시를 삭제합니다.")
             
-            # 모든 캐시 키 가져오기
-            keys = self.redis_client.keys("*")
-            if keys:
-                deleted_count = self.redis_client.delete(*keys)
+            # KEYS/DEL은 서버를 전체 키 수만큼 막으므로 SCAN으로 나눠 가져오고,
+            # 메모리 해제를 백그라운드 스레드에 넘기는 UNLINK를 파이프라인으로 보냄
+            deleted_count = 0
+            pipe = self.redis_client.pipeline(transaction=False)
+            batch = []
+            for key in self.redis_client.scan_iter(count=REDIS_SCAN_BATCH):
+                batch.append(key)
+                if len(batch) >= REDIS_SCAN_BATCH:
+                    pipe.unlink(*batch)
+                    batch = []
+                    deleted_count += sum(pipe.execute())
+            if batch:
+                pipe.unlink(*batch)
+                deleted_count += sum(pipe.execute())
+            
+            if deleted_count:
                 print(f"✅ Redis 캐시 정리 완료: {deleted_count}개 키 삭제")
                 return deleted_count
             else:
@@ -156,12 +206,13 @@ class DataCleaner:
             for model, condition in queries:
                 table_name = model.__tablename__
                 try:
+                    # 별도 COUNT 없이 DELETE의 rowcount를 사용하고, 세션에 올라온
+                    # 객체가 없으므로 세션 동기화도 생략
+                    stmt = delete(model)
                     if condition is not None:
-                        count = session.query(model).filter(condition).count()
-                        session.query(model).filter(condition).delete()
-                    else:
-                        count = session.query(model).count()
-                        session.query(model).delete()
+                        stmt = stmt.where(condition)
+                    result = session.execute(stmt.execution_options(synchronize_session=False))
+                    count = result.rowcount
                     
                     cleaned_counts[table_name] = count
                     print(f"  {table_name}: {count}개 레코드 삭제")
@@ -192,10 +243,13 @@ class DataCleaner:
         # 연결 설정
         await self.setup_connections()
         
-        # 정리 실행
-        file_count, cleaned_dirs = self.clean_files_and_directories(target_date)
-        cache_count = self.clean_redis_cache(target_date)
-        db_counts = self.clean_database(target_date)
+        # 정리 실행 - 파일, Redis, DB는 서로 독립이므로 스레드에서 동시에 진행
+        # (진행 로그는 섞여 출력될 수 있음)
+        (file_count, cleaned_dirs), cache_count, db_counts = await asyncio.gather(
+            asyncio.to_thread(self.clean_files_and_directories, target_date),
+            asyncio.to_thread(self.clean_redis_cache, target_date),
+            asyncio.to_thread(self.clean_database, target_date)
+        )
         
         # 결과 요약
         print(f"\n📊 정리 결과 요약:")
@@ -16,5 +16,6 @@ if __name__ == "__main__":
         'worker',
         '--loglevel=info',
         '--concurrency=2',
-        '-Q', 'default,extraction,heavy'
+        '-Q', 'default,extraction,heavy',
+        '-O', 'fair'
     ])
\ No newline at end of file
@@ -0,0 +1,133 @@
+"""
+PDF parser tests.
+"""
+import pytest
+import fitz
+
+from app.services.pdf_parser import PDFParser
+
+
+def _draw_table(page, cells, x0=72, y0=120, w=120, h=30):
+    """Draw a ruled table with the given cell texts."""
+    rows, cols = len(cells), len(cells[0])
+    for r in range(rows + 1):
+        page.draw_line((x0, y0 + r * h), (x0 + cols * w, y0 + r * h))
+    for c in range(cols + 1):
+        page.draw_line((x0 + c * w, y0), (x0 + c * w, y0 + rows * h))
+    for r, row in enumerate(cells):
+        for c, text in enumerate(row):
+            page.insert_text((x0 + c * w + 5, y0 + r * h + 20), text)
+
+
+@pytest.fixture
+def sample_pdf(tmp_path):
+    """Create a two-page PDF with a ruled 2x2 table on the first page."""
+    path = tmp_path / "sample.pdf"
+    doc = fitz.open()
+
+    page = doc.new_page()
+    page.insert_text((72, 72), "First paragraph on page one.")
+    _draw_table(page, [["Name", "Value"], ["alpha", "1"]])
+
+    page = doc.new_page()
+    page.insert_text((72, 72), "Second page text.")
+
+    doc.save(str(path))
+    doc.close()
+    return str(path)
+
+
+def test_parse_with_pdfplumber_text_and_tables(sample_pdf):
+    """Test pdfplumber fallback extracts text and ruled tables."""
+    result = PDFParser()._parse_with_pdfplumber(sample_pdf)
+
+    assert result["structure"]["total_pages"] == 2
+    assert "First paragraph" in result["text"]
+    assert len(result["tables"]) == 1
+
+    table = result["tables"][0]
+    assert table["page"] == 1
+    assert table["row_count"] == 2
+    assert table["col_count"] == 2
+    assert table["rows"][0] == ["Name", "Value"]
+
+    sections = result["structure"]["sections"]
+    assert sections[0]["table_count"] == 1
+    assert sections[1]["table_count"] == 0
+
+
+def test_process_table_structured_data():
+    """Test header-keyed rows skip empty headers and ragged cells."""
+    parser = PDFParser()
+    table = parser._process_table([
+        ["Name", "", "Age"],
+        [" Kim ", "x", "30", "extra"],
+        [None, None, None],
+    ])
+
+    assert table["headers"] == ["Name", "", "Age"]
+    assert table["rows"][1] == ["Kim", "x", "30", "extra"]
+    assert table["structured_data"] == [
+        {"Name": "Kim", "Age": "30"},
+        {"Name": "", "Age": ""},
+    ]
+
+
+def test_process_table_without_headers():
+    """Test tables whose first row is blank produce no structured data."""
+    table = PDFParser()._process_table([["", None], ["a", "b"]])
+
+    assert table["headers"] == ["", ""]
+    assert table["structured_data"] == []
+    assert table["row_count"] == 2
+
+
+def test_parse_with_pymupdf_blank_page(tmp_path):
+    """Test whitespace-only pages are counted but yield no paragraphs."""
+    path = tmp_path / "blank.pdf"
+    doc = fitz.open()
+    doc.new_page()
+    doc.new_page().insert_text((72, 72), "Only text.")
+    doc.save(str(path))
+    doc.close()
+
+    result = PDFParser()._parse_with_pymupdf(str(path))
+
+    sections = result["structure"]["sections"]
+    assert [s["paragraph_count"] for s in sections] == [0, 1]
+    assert result["paragraphs"] == [{"text": "Only text.", "page": 2, "style": {}}]
+
+
+@pytest.mark.parametrize("page_count", [2, 7])
+def test_extract_tables_with_pdfplumber_page_order(tmp_path, page_count):
+    """Test serial and threaded table extraction keep page order."""
+    path = tmp_path / "tables.pdf"
+    doc = fitz.open()
+    for i in range(page_count):
+        page = doc.new_page()
+        if i % 2 == 0:
+            _draw_table(page, [["Page", "No"], ["p", str(i + 1)]])
+    doc.save(str(path))
+    doc.close()
+
+    tables = PDFParser()._extract_tables_with_pdfplumber(str(path))
+
+    expected_pages = list(range(1, page_count + 1, 2))
+    assert [t["page"] for t in tables] == expected_pages
+    assert [t["index"] for t in tables] == list(range(len(expected_pages)))
+    assert [t["structured_data"] for t in tables] == [
+        [{"Page": "p", "No": str(p)}] for p in expected_pages
+    ]
+
+
+def test_split_into_paragraphs_lists():
+    """Test bullet and numbered lines become separate paragraphs."""
+    text = "Intro line\r\n\r\nLead-in\n1 first\ncontinued\n• second\n\nTail"
+
+    assert PDFParser()._split_into_paragraphs(text) == [
+        "Intro line",
+        "Lead-in",
+        "1 first\ncontinued",
+        "• second",
+        "Tail",
+    ]
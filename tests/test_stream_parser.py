@@ -0,0 +1,239 @@
+"""
+Streaming parser tests.
+"""
+import os
+import aiofiles
+import fitz
+import pytest
+from structlog.testing import capture_logs
+
+from app.core.exceptions import FileTooLargeError
+from app.services.stream_parser import StreamParser, _adaptive_chunk_size, _iter_text_chunks
+
+
+@pytest.fixture
+def parsed_content(monkeypatch):
+    """Replace the HWP parser with one returning this dict (real TextExtractor)."""
+    content = {}
+
+    class FakeParser:
+        def parse(self, file_path):
+            return content
+
+    monkeypatch.setattr("app.services.stream_parser.get_parser", FakeParser)
+    return content
+
+
+async def _iter_chunks(chunks):
+    for chunk in chunks:
+        yield chunk
+
+
+@pytest.mark.asyncio
+async def test_save_uploaded_file_stream_writes_all_chunks():
+    """Test every chunk is persisted in order and the temp file is removed."""
+    parser = StreamParser(chunk_size=16)
+    chunks = [bytes([i]) * (i + 1) for i in range(100)]
+
+    async with parser.save_uploaded_file_stream(_iter_chunks(chunks), ".txt") as path:
+        with open(path, "rb") as f:
+            assert f.read() == b"".join(chunks)
+
+    assert not os.path.exists(path)
+
+
+@pytest.mark.asyncio
+async def test_save_uploaded_file_stream_logs_progress():
+    """Test progress is logged once per 10MB boundary even with uneven chunks."""
+    parser = StreamParser()
+    chunks = [b"x" * (3 * 1024 * 1024)] * 10
+
+    with capture_logs() as logs:
+        async with parser.save_uploaded_file_stream(_iter_chunks(chunks), ".bin"):
+            pass
+
+    progress = [e["mb"] for e in logs if e["event"] == "Streaming file"]
+    assert progress == [12, 21, 30]
+
+
+@pytest.mark.asyncio
+async def test_save_uploaded_file_stream_size_limit():
+    """Test uploads larger than max_file_size are rejected."""
+    parser = StreamParser(max_file_size=10)
+
+    with pytest.raises(FileTooLargeError):
+        async with parser.save_uploaded_file_stream(_iter_chunks([b"x" * 6] * 2), ".txt"):
+            pass
+
+
+@pytest.mark.asyncio
+async def test_stream_text_yields_whole_file(tmp_path):
+    """Test plain-text streaming reassembles to the original content."""
+    path = tmp_path / "sample.txt"
+    text = "한글 텍스트 line\n" * 500
+    path.write_text(text, encoding="utf-8")
+
+    parser = StreamParser(chunk_size=1000)
+    chunks = [c async for c in parser._stream_text(str(path))]
+
+    assert "".join(c["content"] for c in chunks) == text
+    assert chunks[-1]["progress"] == pytest.approx(100)
+
+
+@pytest.mark.asyncio
+async def test_parse_medium_file_mmap_overlaps_extraction(tmp_path):
+    """Test progress chunks are followed by the background extraction result."""
+    path = tmp_path / "medium.bin"
+    path.write_bytes(b"a" * (12 * 1024 * 1024))
+
+    chunks = [c async for c in StreamParser()._parse_medium_file_mmap(str(path), "txt")]
+
+    assert [c["type"] for c in chunks] == ["content_chunk"] * 3 + ["final_content"]
+    assert chunks[-1]["data"]["statistics"]["char_count"] == 12 * 1024 * 1024
+
+
+@pytest.mark.asyncio
+async def test_stream_pdf_pages_in_order(tmp_path):
+    """Test batched page extraction yields every page in order."""
+    path = tmp_path / "pages.pdf"
+    doc = fitz.open()
+    for i in range(19):
+        page = doc.new_page()
+        if i != 5:
+            page.insert_text((72, 72), f"Page {i + 1}")
+    doc.save(str(path))
+    doc.close()
+
+    pages = [c async for c in StreamParser()._stream_pdf(str(path))]
+
+    assert [p["page_number"] for p in pages] == list(range(1, 20))
+    assert pages[5]["content"] == ""
+    assert all(
+        p["content"].strip() == f"Page {p['page_number']}"
+        for p in pages if p["page_number"] != 6
+    )
+    assert pages[-1]["progress"] == pytest.approx(100)
+
+
+def test_stream_text_multibyte_boundaries(tmp_path):
+    """Test UTF-8 sequences split across chunk boundaries are preserved."""
+    path = tmp_path / "korean.txt"
+    text = "가나다라마바사" * 100
+    path.write_text(text, encoding="utf-8")
+
+    # 3바이트 한글이 7바이트 청크 경계에서 계속 잘리도록 설정
+    chunks = list(_iter_text_chunks(str(path), path.stat().st_size, 7))
+
+    assert "".join(c["content"] for c in chunks) == text
+
+
+@pytest.mark.asyncio
+async def test_stream_text_empty_file(tmp_path):
+    """Test empty files produce no chunks."""
+    path = tmp_path / "empty.txt"
+    path.write_bytes(b"")
+
+    assert [c async for c in StreamParser()._stream_text(str(path))] == []
+
+
+@pytest.mark.asyncio
+async def test_stream_hwp_chunks_content(tmp_path, parsed_content):
+    """Test extracted HWP content is re-chunked without loss."""
+    path = tmp_path / "doc.hwp"
+    path.write_bytes(b"dummy")
+    content = "본문" * 12000
+    parsed_content["text"] = content
+
+    chunks = [c async for c in StreamParser()._stream_hwp(str(path))]
+
+    assert [c["offset"] for c in chunks] == [0, 10000, 20000]
+    assert "".join(c["content"] for c in chunks) == content
+    assert chunks[-1]["progress"] == pytest.approx(100)
+
+
+@pytest.mark.asyncio
+async def test_parse_small_file_reads_in_worker(tmp_path):
+    """Test small files are read and extracted in one worker call."""
+    path = tmp_path / "small.txt"
+    path.write_bytes(b"hello")
+
+    chunk = await StreamParser()._parse_small_file(str(path), "txt")
+
+    assert chunk["type"] == "content"
+    assert chunk["data"]["text"] == "hello"
+    assert chunk["data"]["statistics"]["word_count"] == 1
+
+
+@pytest.mark.asyncio
+async def test_stream_text_early_close_and_errors(tmp_path):
+    """Test consumers can stop early and producer errors propagate."""
+    path = tmp_path / "long.txt"
+    path.write_text("x" * 1000000, encoding="utf-8")
+    parser = StreamParser(chunk_size=100)
+
+    stream = parser._stream_text(str(path))
+    first = await stream.__anext__()
+    await stream.aclose()
+    assert set(first["content"]) == {"x"}
+    assert first["progress"] < 100
+
+    with pytest.raises(FileNotFoundError):
+        async for _ in parser._stream_text(str(tmp_path / "missing.txt")):
+            pass
+
+
+def test_adaptive_chunk_size():
+    """Test chunk size grows with data size within bounds and stays aligned."""
+    assert _adaptive_chunk_size(8192, 0) == 64 * 1024
+    assert _adaptive_chunk_size(8192, 400 * 1024 * 1024) == 400 * 1024
+    assert _adaptive_chunk_size(8192, 50 * 1024 ** 3) == 8 * 1024 * 1024
+    assert _adaptive_chunk_size(100000, 0, block_size=4096) % 4096 == 0
+
+
+@pytest.mark.asyncio
+async def test_parse_large_file_stream_dispatch(tmp_path):
+    """Test large files dispatch by type and fall back to text streaming."""
+    pdf_path = tmp_path / "big.pdf"
+    doc = fitz.open()
+    doc.new_page().insert_text((72, 72), "Large PDF")
+    doc.save(str(pdf_path))
+    doc.close()
+    txt_path = tmp_path / "big.txt"
+    txt_path.write_text("plain", encoding="utf-8")
+
+    parser = StreamParser()
+    pdf_chunks = [c async for c in parser._parse_large_file_stream(str(pdf_path), "pdf", 0)]
+    txt_chunks = [c async for c in parser._parse_large_file_stream(str(txt_path), "txt", 5)]
+
+    assert [c["type"] for c in pdf_chunks] == ["page"]
+    assert txt_chunks == [{"type": "text_chunk", "content": "plain", "progress": 100.0}]
+
+
+@pytest.mark.asyncio
+async def test_save_uploaded_file_stream_from_disk_file(tmp_path):
+    """Test file-backed inputs are copied in-kernel from their current position."""
+    source = tmp_path / "source.bin"
+    data = os.urandom(300000)
+    source.write_bytes(data)
+    parser = StreamParser()
+
+    async with parser.save_uploaded_file_stream(source, ".bin") as path:
+        with open(path, "rb") as f:
+            assert f.read() == data
+
+    with open(source, "rb") as src:
+        src.read(1000)
+        async with parser.save_uploaded_file_stream(src, ".bin") as path:
+            with open(path, "rb") as f:
+                assert f.read() == data[1000:]
+        assert src.tell() == len(data)
+
+    # aiofiles 핸들은 fd가 있어도 비동기 스트림으로 기록
+    async with aiofiles.open(source, "rb") as src:
+        async with parser.save_uploaded_file_stream(src, ".bin") as path:
+            with open(path, "rb") as f:
+                assert f.read() == data
+
+    with pytest.raises(FileTooLargeError):
+        async with StreamParser(max_file_size=1000).save_uploaded_file_stream(source, ".bin"):
+            pass
@@ -62,7 +62,27 @@ class TestTextExtractor:
         
         assert "statistics" not in result
         assert "text" in result
-    
+
+    def test_extract_structured_without_text(self, extractor, sample_hwp_content):
+        """Test statistics are still computed when text is not included"""
+        full = extractor.extract_structured(sample_hwp_content, include_structure=False)
+        result = extractor.extract_structured(
+            sample_hwp_content,
+            include_structure=False,
+            include_text=False
+        )
+
+        assert "text" not in result
+        assert result["statistics"] == full["statistics"]
+
+        metadata_only = extractor.extract_structured(
+            sample_hwp_content,
+            include_structure=False,
+            include_statistics=False,
+            include_text=False
+        )
+        assert set(metadata_only) == {"version", "extracted_at", "metadata"}
+
     def test_to_markdown_basic(self, extractor, sample_hwp_content):
         """Test basic markdown conversion"""
         result = extractor.to_markdown(sample_hwp_content)
@@ -111,4 +131,149 @@ class TestTextExtractor:
         
         result = extractor.extract_structured(korean_content)
         assert "안녕하세요" in result["text"]
-        assert result["statistics"]["word_count"] > 0
\ No newline at end of file
+        assert result["statistics"]["word_count"] > 0
+
+    @pytest.mark.parametrize("text,is_heading,level", [
+        ("제1장 총칙", True, 1),
+        ("제 2 절 적용", True, 2),
+        ("제3조 정의", True, 2),
+        ("<Ⅱ> 개요", True, 1),
+        ("Ⅳ. 결론", True, 1),
+        ("<ⅲ> 세부", True, 2),
+        ("1. 목적", True, 2),
+        ("가. 범위", True, 3),
+        ("  가. 범위", True, 2),
+        ("Chapter 3", True, 2),
+        ("일반 문단입니다.", False, 2),
+    ])
+    def test_heading_detection_and_level(self, extractor, text, is_heading, level):
+        """Test heading patterns and the level of the first matching pattern"""
+        assert extractor._is_heading(text, {}) is is_heading
+        assert extractor._get_heading_level(text, {}) == level
+        
+    def test_heading_classification_consistent(self, extractor):
+        """Test heading results agree across structure, paragraphs and markdown"""
+        content = {
+            "paragraphs": [
+                {"text": "제1장 총칙"},
+                {"text": "본문 내용"},
+                {"text": "가. 세부 항목"},
+                "1. 문자열 문단",
+            ]
+        }
+        
+        result = extractor.extract_structured(content)
+        assert [s["index"] for s in result["structure"]["sections"]] == [0, 2]
+        assert [(h["index"], h["level"]) for h in result["headings"]] == [(0, 1), (2, 3), (3, 2)]
+        assert [p["type"] for p in result["paragraphs"]] == ["heading", "normal", "heading", "normal"]
+        
+        markdown = extractor.to_markdown(content, include_metadata=False)
+        assert markdown.split("\n\n") == ["# 제1장 총칙", "본문 내용", "### 가. 세부 항목", "## 1. 문자열 문단"]
+
+    def test_structure_hierarchy(self, extractor):
+        """Test section parents and hierarchy tree follow heading levels"""
+        content = {
+            "paragraphs": [
+                {"text": "제1장 총칙"},
+                {"text": "제1절 목적"},
+                {"text": "가. 범위"},
+                {"text": "제2절 정의"},
+                {"text": "제2장 보칙"},
+            ]
+        }
+
+        structure = extractor.extract_structured(content)["structure"]
+        assert [s.get("parent") for s in structure["sections"]] == [None, 0, 1, 0, None]
+
+        def shape(nodes):
+            return [(n["index"], n["level"], shape(n["children"])) for n in nodes]
+
+        assert shape(structure["hierarchy"]) == [
+            (0, 1, [(1, 2, [(2, 3, [])]), (3, 2, [])]),
+            (4, 1, []),
+        ]
+        
+    def test_extract_lists_types_and_items(self, extractor):
+        """Test list grouping, type detection and prefix stripping"""
+        content = {
+            "paragraphs": [
+                "1. 첫째",
+                "2) 둘째",
+                "본문",
+                "가. 항목",
+                "  - 하위 항목",
+                "• 기호",
+                "3.5배 증가",
+            ]
+        }
+        
+        lists = extractor.extract_structured(content)["lists"]
+        assert [(lst["type"], lst["start_index"], lst["end_index"]) for lst in lists] == [
+            ("ordered", 0, 1),
+            ("korean_ordered", 3, 6),
+        ]
+        assert [item["text"] for item in lists[1]["items"]] == ["항목", "하위 항목", "기호", "5배 증가"]
+        assert [item["level"] for item in lists[1]["items"]] == [1, 2, 1, 1]
+        
+        single = extractor.extract_structured({"paragraphs": ["3.5배 증가"]})["lists"]
+        assert single[0]["type"] == "unordered"
+
+    @pytest.mark.parametrize("text,tags", [
+        ("2024년 3월 1일 시행", ["date", "short"]),
+        ("기한: 2024/03/01, 문의 test@example.com", ["date", "email", "short"]),
+        ("https://example.com 참고", ["url", "short"]),
+        ("연락처 02-123-4567 또는 ₩ 10,000", ["phone", "currency", "short"]),
+        ("날짜 없는 평범한 문단", ["short"]),
+        ("$5", ["currency", "short"]),
+        ("", ["short"]),
+        ("   \n ", ["short"]),
+    ])
+    def test_tag_paragraph(self, extractor, text, tags):
+        """Test semantic tags with and without their required literals"""
+        assert extractor._tag_paragraph(text) == tags
+
+    def test_extract_tables_from_delimited_text(self, extractor):
+        """Test <> delimited paragraphs are parsed into tables"""
+        content = {
+            "paragraphs": [{"text": "<이름><나이><지역>\n< 김철수 ><30><서울>\n<이영희><25>"}]
+        }
+        
+        table = extractor.extract_structured(content)["tables"][0]
+        assert table["headers"] == ["이름", "나이", "지역"]
+        assert table["rows"] == [["김철수", "30", "서울"], ["이영희", "25"]]
+        assert table["structured_data"][1] == {"이름": "이영희", "나이": "25"}
+        assert table["col_count"] == 3
+
+    def test_extract_tables_cell_types(self, extractor):
+        """Test raw table cells are stringified and classified by position"""
+        content = {"paragraphs": [], "tables": [{"rows": [["항목", "값"], ["가격", 100], [], ["수량", 3, None]]}]}
+
+        table = extractor.extract_structured(content)["tables"][0]
+        assert table["rows"] == [["항목", "값"], ["가격", "100"], ["수량", "3", "None"]]
+        assert [(c["row"], c["col"], c["type"]) for c in table["cells"]] == [
+            (0, 0, "header"), (0, 1, "header"),
+            (1, 0, "row_header"), (1, 1, "data"),
+            (3, 0, "row_header"), (3, 1, "data"), (3, 2, "data"),
+        ]
+        assert (table["row_count"], table["col_count"]) == (4, 3)
+
+    def test_statistics_counts(self, extractor):
+        """Test character, language and sentence statistics"""
+        content = {"paragraphs": [], "text": "한글 ab.\n  C?! "}
+        
+        stats = extractor.extract_structured(content)["statistics"]
+        assert stats["char_count"] == 13
+        assert stats["char_count_no_spaces"] == 8
+        assert stats["korean_ratio"] == 2 / 13
+        assert stats["english_ratio"] == 3 / 13
+        assert stats["sentence_count"] == 2
+        assert stats["avg_sentence_length"] == 1.5
+
+    def test_paragraph_length_statistics(self, extractor):
+        """Test average, max and min paragraph word counts"""
+        content = {"paragraphs": ["한 단어", "세 단어 문단", "하나", "네 단어 로 된"]}
+
+        stats = extractor.extract_structured(content)["statistics"]
+        assert stats["avg_paragraph_length"] == 10 / 4
+        assert stats["max_paragraph_length"] == 4
+        assert stats["min_paragraph_length"] == 1
@@ -31,6 +31,21 @@ def test_get_file_hash():
         os.unlink(tmp_path)
 
 
+def test_get_file_hash_mmap(monkeypatch):
+    """Test large-file hashing through mmap gives the same digest."""
+    from app.utils import file_utils
+    monkeypatch.setattr(file_utils, "MMAP_HASH_THRESHOLD", 1)
+    
+    with tempfile.NamedTemporaryFile(delete=False) as tmp:
+        tmp.write(b"Hello, World!")
+        tmp_path = tmp.name
+    
+    try:
+        assert get_file_hash(tmp_path) == "dffd6021bb2bd5b0af676290809ec3a53191dd81c7f70a4b28688a362182986f"
+    finally:
+        os.unlink(tmp_path)
+
+
 def test_validate_hwp_file_valid():
     """Test HWP file validation with valid file."""
     # Create a mock HWP file with OLE signature